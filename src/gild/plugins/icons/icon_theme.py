@@ -55,27 +55,35 @@ class IconTheme(Declarative):
             Icon matching the id or None if no icon match the provided id.
 
         """
-        if not self._icons and self.children:
-            self._refresh_children_icons()
-
         if icon_id in self._icons:
             return self._icons[icon_id].get_icon(manager, self)
 
         else:
             return None
 
+    def child_added(self, child: Declarative) -> None:
+        """Register the icons as they are added as children to this theme."""
+        super(IconTheme, self).child_added(child)
+        if isinstance(child, Icon):
+            self._icons[child.id] = child
+
+    def child_removed(self, child: Declarative) -> None:
+        """Unregister the icons as they are removed from this theme."""
+        super(IconTheme, self).child_removed(child)
+        if isinstance(child, Icon) and self._icons.get(child.id) is child:
+            del self._icons[child.id]
+            # Restore an icon with the same id that may have been shadowed.
+            # HINT when reparenting enaml does not properly update the children
+            for c in reversed(self.children):
+                if isinstance(c, Icon) and c.parent is self and c.id == child.id:
+                    self._icons[c.id] = c
+                    break
+
     # --- Private API ---------------------------------------------------------
 
     #: Map of id: icon as declared as children to this theme.
     _icons = Dict()
 
-    def _refresh_children_icons(self) -> None:
-        """Refresh the mapping of the icons contributed as children."""
-        # HINT when reparenting enaml does not properly update the children
-        for c in [c for c in self.children if c.parent is self]:
-            if isinstance(c, Icon):
-                self._icons[c.id] = c
-
 
 class IconThemeExtension(Declarative):
     """Declarative object used to contribute new icons to an existing theme."""
@@ -88,11 +96,25 @@ class IconThemeExtension(Declarative):
 
     def icons(self) -> TList["Icon"]:
         """List the associated icons."""
-        if not self._icons:
-            self._icons = [c for c in self.children if isinstance(c, Icon)]
-
         return self._icons
 
+    def child_added(self, child: Declarative) -> None:
+        """Keep track of the icons added as children."""
+        super(IconThemeExtension, self).child_added(child)
+        if isinstance(child, Icon) and child not in self._icons:
+            self._icons.append(child)
+
+    def child_removed(self, child: Declarative) -> None:
+        """Forget the icons removed from the extension.
+
+        Icons moved to the theme they extend remain listed since the extension
+        still owns them.
+
+        """
+        super(IconThemeExtension, self).child_removed(child)
+        if isinstance(child, Icon) and child.parent is None and child in self._icons:
+            self._icons.remove(child)
+
     # --- Private API ---------------------------------------------------------
 
     #: Private list of contributed icons.
@@ -9,10 +9,11 @@
 
 """
 import logging
+from collections import defaultdict
 from traceback import format_exc
 from typing import Any, Mapping
 
-from atom.api import List, Str, Typed
+from atom.api import Bool, Dict, List, Str, Typed
 from enaml.icon import Icon as EnamlIcon
 
 from gild.utils.plugin_tools import (
@@ -61,22 +62,19 @@ class IconManagerPlugin(HasPreferencesPlugin):
         if self.fallback_theme not in self.icon_themes:
             self.fallback_theme = "gild.FontAwesome"
 
-        checker = make_extension_validator(IconThemeExtension, (), ("theme",))
-        self._icon_theme_extensions = ExtensionsCollector(
-            workbench=self.workbench,
-            point=ICON_THEME_EXTENSION_POINT,
-            ext_class=IconThemeExtension,
-            validate_ext=checker,
-        )
-        self._icon_theme_extensions.start()
-        self._add_extensions_to_selected_theme({})
-
-        self._bind_observers()
+        self._icon_themes.observe("contributions", self._list_icon_themes)
 
     def stop(self) -> None:
         """Stop the plugin and clean up."""
-        self._unbind_observers()
-        self._icon_theme_extensions.stop()
+        self._icon_themes.unobserve("contributions", self._list_icon_themes)
+        if self._extensions_started:
+            self._icon_theme_extensions.unobserve(
+                "contributions", self._add_extensions_to_selected_theme
+            )
+            self._icon_theme_extensions.stop()
+            del self._icon_theme_extensions
+            del self._extensions_by_theme
+            self._extensions_started = False
         self._icon_themes.stop()
 
     def get_icon(self, icon_id: str) -> EnamlIcon:
@@ -85,8 +83,16 @@ class IconManagerPlugin(HasPreferencesPlugin):
         Fallback to fallback_theme if no matching icon is found in the selected
         theme.
 
+        Successfully resolved icons are cached till the selected themes or the
+        contributed themes and extensions change.
+
         """
-        icon_theme = self._icon_themes.contributions[self.current_theme]
+        cached = self._icons_cache.get(icon_id)
+        if cached is not None:
+            return cached
+
+        self._ensure_extensions()
+        icon_theme = self._current_theme
         icon = None
         msg = ""
         try:
@@ -100,7 +106,7 @@ class IconManagerPlugin(HasPreferencesPlugin):
                 msg = msg % (self.current_theme, icon_id)
 
         if msg:
-            fallback = self._icon_themes.contributions[self.fallback_theme]
+            fallback = self._fallback_theme
             try:
                 icon = fallback.get_icon(self, icon_id)
             except Exception:
@@ -116,6 +122,9 @@ class IconManagerPlugin(HasPreferencesPlugin):
             logger = logging.getLogger(__name__)
             logger.warning(msg)
 
+        if icon is not None:
+            self._icons_cache[icon_id] = icon
+
         return icon
 
     # --- Private API ---------------------------------------------------------
@@ -126,60 +135,101 @@ class IconManagerPlugin(HasPreferencesPlugin):
     #: Collector for the declared icon theme extensions.
     _icon_theme_extensions = Typed(ExtensionsCollector)
 
+    #: Whether the icon theme extensions collector has been started. The
+    #: collector is only started when the first icon is resolved.
+    _extensions_started = Bool()
+
+    #: Contributed icon theme extensions grouped by the id of their theme.
+    _extensions_by_theme = Dict()
+
     #: Currently selected theme.
     _current_theme = Typed(IconTheme)
 
+    #: Theme used as fallback.
+    _fallback_theme = Typed(IconTheme)
+
+    #: Cache of the icons already resolved.
+    _icons_cache = Dict()
+
     def _add_extensions_to_selected_theme(self, change: Mapping[str, Any]) -> None:
         """Add contributed theme extension to the selected theme."""
+        self._icons_cache.clear()
         selected = self._current_theme
 
         # Assign all contributed icons from all extensions.
         if not change:
-            for k, v in self._icon_theme_extensions.contributions.items():
-                if v.theme == selected.id:
-                    selected.insert_children(None, v.icons())
+            for v in self._extensions_by_theme.get(selected.id, ()):
+                selected.insert_children(None, v.icons())
 
         # Only update icons provided by new extensions.
         else:
-            added = set(change["value"]) - set(change.get("oldvalue", {}))
-            removed = set(change.get("oldvalue", {})) - set(change["value"])
-            ext = dict(change["value"])
-            ext.update(change.get("oldvalue", {}))
-            for k in added:
-                v = ext[k]
+            del self._extensions_by_theme
+            new = change["value"]
+            old = change.get("oldvalue", {})
+            for k in new.keys() - old.keys():
+                v = new[k]
                 if v.theme == selected.id:
                     selected.insert_children(None, v.icons())
-            for k in removed:
-                v = ext[k]
+            # Move back the icons of removed extensions under the extension so
+            # that the theme forgets about them.
+            for k in old.keys() - new.keys():
+                v = old[k]
                 if v.theme == selected.id:
                     v.insert_children(None, v.icons())
 
-        del selected._icons
-
     def _post_setattr_current_theme(self, old: str, new: str) -> None:
         """Add the extension icons to the theme."""
         del self._current_theme
-        if self._icon_theme_extensions:
+        self._icons_cache.clear()
+        if self._extensions_started:
             self._add_extensions_to_selected_theme({})
 
+    def _post_setattr_fallback_theme(self, old: str, new: str) -> None:
+        """Discard the icons resolved using the previous fallback theme."""
+        del self._fallback_theme
+        self._icons_cache.clear()
+
     def _list_icon_themes(self, change: Mapping[str, Any]) -> None:
         """List the declared icon themes."""
+        self._icons_cache.clear()
+        del self._current_theme
+        del self._fallback_theme
         self.icon_themes = sorted(self._icon_themes.contributions)
+        # The selected theme may have been re-contributed as a new object which
+        # does not yet hold the extensions icons.
+        if self._extensions_started and self.current_theme in self.icon_themes:
+            self._add_extensions_to_selected_theme({})
 
-    def _bind_observers(self) -> None:
-        """Setup the observers on the contributions."""
-        self._icon_themes.observe("contributions", self._list_icon_themes)
-        self._icon_theme_extensions.observe(
-            "contributions", self._add_extensions_to_selected_theme
-        )
+    def _ensure_extensions(self) -> None:
+        """Collect the icon theme extensions if it was not already done."""
+        if self._extensions_started:
+            return
+        self._extensions_started = True
 
-    def _unbind_observers(self) -> None:
-        """Remove the observers on the contributions."""
-        self._icon_themes.unobserve("contributions", self._list_icon_themes)
-        self._icon_theme_extensions.unobserve(
+        checker = make_extension_validator(IconThemeExtension, (), ("theme",))
+        self._icon_theme_extensions = ExtensionsCollector(
+            workbench=self.workbench,
+            point=ICON_THEME_EXTENSION_POINT,
+            ext_class=IconThemeExtension,
+            validate_ext=checker,
+        )
+        self._icon_theme_extensions.start()
+        self._add_extensions_to_selected_theme({})
+        self._icon_theme_extensions.observe(
             "contributions", self._add_extensions_to_selected_theme
         )
 
     def _default__current_theme(self) -> IconTheme:
         """Get the current theme object based on the current_theme member."""
         return self._icon_themes.contributions[self.current_theme]
+
+    def _default__fallback_theme(self) -> IconTheme:
+        """Get the fallback theme object based on the fallback_theme member."""
+        return self._icon_themes.contributions[self.fallback_theme]
+
+    def _default__extensions_by_theme(self) -> dict:
+        """Group the contributed icon theme extensions by theme id."""
+        by_theme = defaultdict(list)
+        for ext in self._icon_theme_extensions.contributions.values():
+            by_theme[ext.theme].append(ext)
+        return dict(by_theme)
@@ -126,14 +126,20 @@ class LifecyclePlugin(Plugin):
         """
         attr = "run" if change["object"] is self.startup else "clean"
         heap = self._start_heap if attr == "run" else self._clean_heap
-        old = set(change["oldvalue"].values()) if "oldvalue" in change else set()
-        new = set(change["value"].values())
+        old = change.get("oldvalue", {})
+        new = change["value"]
 
-        removed = old - new
-        added = new - old
+        # Diff on the ids and then check that contributions kept under the same
+        # id were not replaced.
+        for k in old.keys() - new.keys():
+            heap.remove(old[k])
 
-        for r in removed:
-            heap.remove(r)
-
-        for a in added:
+        for k in new.keys() - old.keys():
+            a = new[k]
             heap.push(a.priority, a)
+
+        for k in old.keys() & new.keys():
+            o, n = old[k], new[k]
+            if o is not n:
+                heap.remove(o)
+                heap.push(n.priority, n)
@@ -10,9 +10,8 @@
 This plugin offers the possibility to add custom handlers, filters and formatters.
 
 """
-import enaml
+from gild.utils import make_lazy_getattr
 
-with enaml.imports():
-    from .manifest import LogManifest
+__getattr__ = make_lazy_getattr(__name__, {"LogManifest": ".manifest"})
 
 __all__ = ["LogManifest"]
@@ -8,9 +8,10 @@
 """Log plugin definition.
 
 """
+import io
 import logging
 import os
-from typing import Callable
+from typing import Callable, Optional
 
 import enaml
 from atom.api import Dict, List, Str, Tuple, Typed
@@ -24,6 +25,40 @@ with enaml.imports():
 
 MODULE_PATH = os.path.dirname(__file__)
 
+#: Maximal number of bytes read from the end of the log file to display it.
+MAX_DISPLAYED_LOG_SIZE = 2 * 1024 * 1024
+
+
+def _read_log_tail(
+    path: str, encoding: Optional[str] = None, max_size: Optional[int] = None
+) -> str:
+    """Read the end of a log file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the log file.
+
+    encoding : str, optional
+        Encoding of the file. Default to the locale encoding.
+
+    max_size : int, optional
+        Maximal number of bytes to read from the end of the file, the first
+        partial line being discarded. Default to MAX_DISPLAYED_LOG_SIZE.
+
+    """
+    if max_size is None:
+        max_size = MAX_DISPLAYED_LOG_SIZE
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size > max_size:
+            f.seek(size - max_size)
+            f.readline()
+        else:
+            f.seek(0)
+        with io.TextIOWrapper(f, encoding=encoding, errors="replace") as text:
+            return text.read()
+
 
 class LogPlugin(Plugin):
     """Plugin managing the application logging."""
@@ -42,8 +77,8 @@ class LogPlugin(Plugin):
 
     def display_current_log(self) -> None:
         """Display the current instance of the rotating log file."""
-        with open(self.rotating_log.path) as f:
-            log = f.read()
+        handler = self.rotating_log
+        log = _read_log_tail(handler.path, handler.encoding)
         LogDialog(log=log).exec_()
 
     def add_handler(self, id: str, handler: logging.Handler, logger="") -> None:
@@ -67,8 +102,16 @@ class LogPlugin(Plugin):
 
         logger.addHandler(handler)
 
-        self._handlers[id] = (handler, name)
-        self.handler_ids = list(self._handlers.keys())
+        handlers = self._handlers
+        is_new = id not in handlers
+        handlers[id] = handler
+        self._handler_loggers[id] = name
+        # The list is copied rather than appended to: in place mutations of a
+        # List member do not notify the state plugin observers, and using a
+        # ContainerList would share this mutable list with the read-only state.
+        # The copy only happens when an id is added and the list stays short.
+        if is_new:
+            self.handler_ids = [*self.handler_ids, id]
 
     def remove_handler(self, id: str) -> None:
         """Remove the specified handler.
@@ -81,16 +124,17 @@ class LogPlugin(Plugin):
         """
         handlers = self._handlers
         if id in handlers:
-            handler, logger_name = handlers.pop(id)
-            logger = logging.getLogger(logger_name)
+            handler = handlers.pop(id)
+            logger = logging.getLogger(self._handler_loggers.pop(id))
             logger.removeHandler(handler)
-            for filter_id in self.filter_ids:
-                infos = self._filters[filter_id]
-                if infos[1] == id:
-                    del self._filters[filter_id]
+            filters = self._filters
+            removed = [f_id for f_id, infos in filters.items() if infos[1] == id]
+            for filter_id in removed:
+                del filters[filter_id]
 
-            self.filter_ids = list(self._filters.keys())
-            self.handler_ids = list(self._handlers.keys())
+            if removed:
+                self.filter_ids = list(filters)
+            self.handler_ids = list(handlers)
 
     def add_filter(
         self, id: str, filter: Callable[[logging.LogRecord], bool], handler_id: str
@@ -116,11 +160,14 @@ class LogPlugin(Plugin):
 
         handlers = self._handlers
         if handler_id in handlers:
-            handler, _ = handlers[handler_id]
-            handler.addFilter(filter)
-            self._filters[id] = (filter, handler_id)
+            handlers[handler_id].addFilter(filter)
+            filters = self._filters
+            is_new = id not in filters
+            filters[id] = (filter, handler_id)
 
-            self.filter_ids = list(self._filters.keys())
+            # Copied for the same reason as handler_ids in add_handler.
+            if is_new:
+                self.filter_ids = [*self.filter_ids, id]
 
         else:
             logger = logging.getLogger(__name__)
@@ -138,9 +185,8 @@ class LogPlugin(Plugin):
         filters = self._filters
         if id in filters:
             filter, handler_id = filters.pop(id)
-            handler, _ = self._handlers[handler_id]
-            handler.removeFilter(filter)
-            self.filter_ids = list(self._filters.keys())
+            self._handlers[handler_id].removeFilter(filter)
+            self.filter_ids = list(filters)
 
     def set_formatter(self, handler_id: str, formatter: logging.Formatter) -> None:
         """Set the formatter of the specified handler.
@@ -157,8 +203,7 @@ class LogPlugin(Plugin):
         handlers = self._handlers
         handler_id = str(handler_id)
         if handler_id in handlers:
-            handler, _ = handlers[handler_id]
-            handler.setFormatter(formatter)
+            handlers[handler_id].setFormatter(formatter)
 
         else:
             logger = logging.getLogger(__name__)
@@ -166,8 +211,11 @@ class LogPlugin(Plugin):
 
     # ---- Private API --------------------------------------------------------
 
-    # Mapping between handler ids and handler, logger name pairs.
-    _handlers = Dict(Str(), Tuple())
+    # Mapping between handler ids and handlers.
+    _handlers = Dict(Str(), Typed(logging.Handler))
+
+    # Mapping between handler ids and the name of the logger they are attached to.
+    _handler_loggers = Dict(Str(), Str())
 
     # Mapping between filter_id and filter, handler_id pairs.
     _filters = Dict(Str(), Tuple())
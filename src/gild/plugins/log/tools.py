@@ -29,11 +29,12 @@ import logging
 import os
 import queue
 import time
+from collections import deque
 from logging.handlers import TimedRotatingFileHandler
-from threading import Thread
-from typing import IO, Literal, Union
+from threading import Lock, Thread
+from typing import IO, Deque, Dict, Literal, Union
 
-from atom.api import Atom, Int, Str
+from atom.api import Atom, Int, Property, Typed
 from enaml.application import deferred_call
 
 
@@ -76,8 +77,7 @@ class StreamToLogRedirector(object):
 
         """
         message = message.strip()
-        message = str(message)
-        if message != "":
+        if message:
             self.logger.info(message)
 
     def write_error(self, message: str) -> None:
@@ -88,8 +88,7 @@ class StreamToLogRedirector(object):
 
         """
         message = message.strip()
-        message = str(message)
-        if message != "":
+        if message:
             self.logger.critical(message)
 
     def flush(self) -> None:
@@ -120,13 +119,21 @@ class QueueLoggerThread(Thread):
         or till the flag attribute is True.
 
         """
+        # Cache the loggers locally to avoid going through the logging lock
+        # for each record.
+        loggers: Dict[str, logging.Logger] = {}
+        get_logger = loggers.get
+        get_record = self.queue.get
         while self.flag:
             # Collect all display output from process
             try:
-                record = self.queue.get(timeout=0.5)
+                record = get_record(timeout=0.5)
                 if record is None:
                     break
-                logger = logging.getLogger(record.name)
+                name = record.name
+                logger = get_logger(name)
+                if logger is None:
+                    logger = loggers[name] = logging.getLogger(name)
                 logger.handle(record)
             except queue.Empty:
                 continue
@@ -136,30 +143,51 @@ class LogModel(Atom):
     """Simple object which can be used in a GuiHandler."""
 
     #: Text representing all the messages sent by the handler.
-    #: Should not be altered by user code.
-    text = Str()
+    #: The text is only rebuilt when read or observed so that messages logged
+    #: while no view displays the model do not pay for joining the lines.
+    text = Property(cached=True)
 
     #: Maximum number of lines.
     buff_size = Int(1000)
 
     def clean_text(self):
         """Empty the text member."""
-        self.text = ""
-        self._lines = 0
+        self._lines.clear()
+        self.get_member("text").reset(self)
 
     def add_message(self, message):
         """Add a message to the text member."""
-        if self._lines > self.buff_size:
-            self.text = self.text.split("\n", self._lines - self.buff_size)[-1]
-        message = message.strip()
-        message = str(message)
-        message += "\n"
+        self.add_messages((message,))
+
+    def add_messages(self, messages):
+        """Add several messages to the text member at once.
+
+        Each message is stripped individually and the text is updated a single
+        time.
+
+        """
+        lines = self._lines
+        for message in messages:
+            lines.extend(message.strip().split("\n"))
+        self.get_member("text").reset(self)
+
+    # --- Private API ---------------------------------------------------------
 
-        self._lines += message.count("\n")
-        self.text += message
+    #: Lines currently displayed, older lines are discarded by the deque itself.
+    _lines = Typed(deque)
 
-    #: Number of lines.
-    _lines = Int()
+    def _get_text(self) -> str:
+        """Join the lines currently in the buffer."""
+        return "\n".join(self._lines) + "\n" if self._lines else ""
+
+    def _default__lines(self):
+        # The last line is kept on top of the buffer size (historical behavior).
+        return deque(maxlen=self.buff_size + 1)
+
+    def _post_setattr_buff_size(self, old, new):
+        """Resize the buffer while preserving the most recent lines."""
+        self._lines = deque(self._lines, maxlen=new + 1)
+        self.get_member("text").reset(self)
 
 
 ERR_MESS = "An error occured please check the log file for more details."
@@ -186,27 +214,43 @@ class GuiHandler(logging.Handler):
     def __init__(self, model: LogModel) -> None:
         logging.Handler.__init__(self)
         self.model = model
+        self._pending: Deque[str] = deque()
+        self._pending_lock = Lock()
+        self._scheduled = False
 
     def emit(self, record: logging.LogRecord) -> None:
         """Write the log record message to the model.
 
-        Use Html encoding to add colors, etc.
+        Messages are buffered and sent to the model in a single batch on the
+        next iteration of the event loop.
 
         """
         # TODO add coloring. Better to create a custom formatter
         try:
             msg = self.format(record)
             if record.levelname == "INFO":
-                deferred_call(self.model.add_message, msg + "\n")
+                msg = msg + "\n"
             elif record.levelname == "CRITICAL":
-                deferred_call(self.model.add_message, ERR_MESS + "\n")
+                msg = ERR_MESS + "\n"
             else:
-                deferred_call(
-                    self.model.add_message, record.levelname + ": " + msg + "\n"
-                )
+                msg = record.levelname + ": " + msg + "\n"
+            with self._pending_lock:
+                self._pending.append(msg)
+                if self._scheduled:
+                    return
+                self._scheduled = True
+            deferred_call(self._drain)
         except Exception:
             pass
 
+    def _drain(self) -> None:
+        """Send all the pending messages to the model at once."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, deque()
+            self._scheduled = False
+        if pending:
+            self.model.add_messages(pending)
+
 
 class DayRotatingTimeHandler(TimedRotatingFileHandler):
     """Custom implementation of the TimeRotatingHandler to avoid issues on
@@ -219,6 +263,12 @@ class DayRotatingTimeHandler(TimedRotatingFileHandler):
     def __init__(self, filename: str, mode: str = "wb", **kwargs) -> None:
         self.mode = mode
         self.path = ""
+        # Split the filename once since it is needed each time a file is opened.
+        base_dir, base_filename = os.path.split(os.path.abspath(filename))
+        aux = base_filename.split(".")
+        self._base_dir = base_dir
+        self._prefix = aux[0]
+        self._ext = aux[1]
         super(DayRotatingTimeHandler, self).__init__(
             filename, when="MIDNIGHT", **kwargs
         )
@@ -229,18 +279,18 @@ class DayRotatingTimeHandler(TimedRotatingFileHandler):
 
         """
         today = str(datetime.date.today())
-
-        base_dir, base_filename = os.path.split(self.baseFilename)
-        aux = base_filename.split(".")
+        prefix = self._prefix + today
+        ext = self._ext
 
         # Change filename when the logging system start several time on the
         # same day.
+        with os.scandir(self._base_dir) as entries:
+            existing = {e.name for e in entries}
         i = 0
-        filename = aux[0] + today + "_%d" + "." + aux[1]
-        while os.path.isfile(os.path.join(base_dir, filename % i)):
+        while f"{prefix}_{i}.{ext}" in existing:
             i += 1
 
-        path = os.path.join(base_dir, filename % i)
+        path = os.path.join(self._base_dir, f"{prefix}_{i}.{ext}")
         self.path = path
 
         if self.encoding is None or self.encoding == "locale":
@@ -8,10 +8,8 @@
 """ Plugin handling loading extension packages at startup.
 
 """
-import enaml
-
-with enaml.imports():
-    from .manifest import PackagesManifest
+from gild.utils import make_lazy_getattr
 
+__getattr__ = make_lazy_getattr(__name__, {"PackagesManifest": ".manifest"})
 
 __all__ = ["PackagesManifest"]
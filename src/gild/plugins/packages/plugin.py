@@ -8,7 +8,7 @@
 """Plugin handling the collection and registering of extension packages.
 
 """
-import importlib.metadata
+import heapq
 import logging
 from traceback import format_exc
 from typing import MutableMapping, Union
@@ -16,6 +16,8 @@ from typing import MutableMapping, Union
 from atom.api import Dict, List
 from enaml.workbench.api import Plugin, PluginManifest
 
+from gild.utils import iter_entry_points
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,10 +32,11 @@ class PackagesPlugin(Plugin):
 
     def stop(self) -> None:
         """Unregister all manifest contributed by extension packages."""
-        # Sort to respect the given priority when unregistering.
-        heap = sorted(self._registered)
-        for manifest_id in heap:
-            self.workbench.unregister(manifest_id[2])
+        # Pop from the heap to respect the given priority when unregistering.
+        heap = self._registered
+        while heap:
+            _, _, manifest_id = heapq.heappop(heap)
+            self.workbench.unregister(manifest_id)
 
         self.packages.clear()
         self._registered = []
@@ -46,12 +49,17 @@ class PackagesPlugin(Plugin):
 
         packages: MutableMapping[str, Union[str, MutableMapping[str, str]]] = dict()
         registered: List[PluginManifest] = []
+
+        def signal_package_error(name: str, msg: str) -> None:
+            """Record and signal an error preventing to load a package."""
+            packages[name] = msg
+            # The errors plugin may keep the parameters so a new dict is needed.
+            core.invoke_command(cmd, {"kind": "package", "id": name, "message": msg})
+
         core.invoke_command("gild.errors.enter_error_gathering", {})
         # Importlib can duplicate entry points in some cases (editable install)
-        # so we remove the duplicates.
-        entry_points = set(
-            importlib.metadata.entry_points()[self.manifest.extension_point]
-        )
+        # so we remove the duplicates while preserving the order.
+        entry_points = dict.fromkeys(iter_entry_points(self.manifest.extension_point))
         for ep in entry_points:
 
             # Attempt to load the entry point.
@@ -60,8 +68,7 @@ class PackagesPlugin(Plugin):
             except Exception:
                 msg = "Could not load extension package %s : %s"
                 msg = msg % (ep.name, format_exc())
-                packages[ep.name] = msg
-                core.invoke_command(cmd, dict(kind="package", id=ep.name, message=msg))
+                signal_package_error(ep.name, msg)
                 continue
 
             # Get all manifests
@@ -70,22 +77,22 @@ class PackagesPlugin(Plugin):
             except Exception:
                 msg = "Could not obtain extension manifests for extension %s : %s"
                 msg = msg % (ep.name, format_exc())
-                packages[ep.name] = msg
-                core.invoke_command(cmd, dict(kind="package", id=ep.name, message=msg))
+                signal_package_error(ep.name, msg)
                 continue
 
             if not isinstance(manifests, list):
                 msg = "Package %s entry point must return a list, not %s"
                 msg = msg % (ep.name, str(type(manifests)))
-                packages[ep.name] = msg
-                core.invoke_command(cmd, dict(kind="package", id=ep.name, message=msg))
+                signal_package_error(ep.name, msg)
                 continue
 
-            if any(not issubclass(m, PluginManifest) for m in manifests):
+            if any(
+                not (isinstance(m, type) and issubclass(m, PluginManifest))
+                for m in manifests
+            ):
                 msg = "Package %s entry point must only return PluginManifests"
                 msg = msg % ep.name
-                packages[ep.name] = msg
-                core.invoke_command(cmd, dict(kind="package", id=ep.name, message=msg))
+                signal_package_error(ep.name, msg)
                 continue
 
             ext_pack_contrib: MutableMapping[str, str] = {}
@@ -104,7 +111,7 @@ class PackagesPlugin(Plugin):
                 priority = getattr(inst, "priority", 100)
                 # Keep the insertion index, to avoid comparing id when
                 # sorting (it would make no sense).
-                registered.append((priority, len(registered), inst.id))
+                heapq.heappush(registered, (priority, len(registered), inst.id))
 
         self.packages = packages
         self._registered = registered
@@ -114,5 +121,5 @@ class PackagesPlugin(Plugin):
     # --- Private API ---------------------------------------------------------
     # =========================================================================
 
-    #: Private list of registered manifest used when stopping the plugin.
+    #: Private heap of registered manifest used when stopping the plugin.
     _registered = List(tuple)
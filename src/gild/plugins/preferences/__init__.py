@@ -8,11 +8,10 @@
 """Managing preferences saving/loading.
 
 """
-import enaml
+from gild.utils import make_lazy_getattr
 
 from .preferences import Preferences
 
-with enaml.imports():
-    from .manifest import PreferencesManifest
+__getattr__ = make_lazy_getattr(__name__, {"PreferencesManifest": ".manifest"})
 
 __all__ = ["Preferences", "PreferencesManifest"]
@@ -8,14 +8,16 @@
 """Preferences plugin definition.
 
 """
+import logging
 import os
 import pathlib
-from collections import OrderedDict
-from functools import partial
-from typing import Any, Mapping, Optional
+import queue
+from threading import Thread
+from typing import Any, Callable, Mapping, Optional, Tuple
 
 import rtoml as toml
-from atom.api import Dict, Str, Typed
+from atom.api import Bool, Dict, Str, Typed
+from enaml.application import Application, deferred_call
 from enaml.workbench.api import Plugin
 
 from gild.utils.plugin_tools import ExtensionsCollector
@@ -24,6 +26,8 @@ from .preferences import Preferences
 
 PREFS_POINT = "gild.preferences.plugin"
 
+logger = logging.getLogger(__name__)
+
 
 def dictsubtype_as_dict(adict: dict) -> dict:
     out = {}
@@ -48,25 +52,22 @@ class PrefPlugin(Plugin):
         """Start the plugin, locate app folder and load default preferences."""
         # Look for the app specific storage under the user to locate the application
         # folder that may be stored somewhere else.
+        # If the file does not exist (the startup sequence did not run), the
+        # default location proposed at startup is used.
         storage_path = pathlib.Path.home() / f".{self.manifest.application_name}"
-        if storage_path.is_file():
-            self.app_directory = app_path = toml.load(storage_path)["app_path"]
-        else:
-            raise RuntimeError(
-                "The location file does not exist. This should "
-                "never happen since it is created during the app startup, "
-                "ensure that the preference plugin startup sequence runs before "
-                "starting the plugin."
-            )
+        if not storage_path.is_file():
+            self._bootstrap_location(storage_path)
+        app_path = toml.load(storage_path)["app_path"]
 
         self.app_directory = app_path
-        self._prefs = OrderedDict()
+        self._prefs = {}
 
         pref_path = pathlib.Path(app_path) / "preferences"
         if not pref_path.is_dir():
             pref_path.mkdir()
 
         default_pref_path = pref_path / "default.toml"
+        self._default_pref_file = str(default_pref_path)
         self._last_saved_pref_file = str(default_pref_path)
         if default_pref_path.is_file():
             self._prefs = toml.load(default_pref_path)
@@ -75,11 +76,21 @@ class PrefPlugin(Plugin):
             workbench=self.workbench, point=PREFS_POINT, ext_class=Preferences
         )
         self._pref_decls.start()
+        self._pref_decls.observe("contributions", self._clear_pref_methods)
+
+        self._write_queue = queue.Queue()
+        self._writer = Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
 
     def stop(self) -> None:
         """Stop the plugin."""
+        self._write_auto_saved()
+        self._write_queue.put(None)
+        self._writer.join()
+        del self._writer, self._write_queue
         self._pref_decls.stop()
         del self._prefs
+        self._pref_methods.clear()
 
     def save_preferences(self, path: Optional[str] = None) -> None:
         """Collect and save preferences for all registered plugins.
@@ -92,18 +103,28 @@ class PrefPlugin(Plugin):
 
         """
         if path is None:
-            path = os.path.join(self.app_directory, "preferences", "default.toml")
+            path = self._default_pref_file
 
-        prefs = OrderedDict()
+        prefs = {}
+        stored = self._prefs
         for plugin_id in self._pref_decls.contributions:
-            plugin = self.workbench.get_plugin(plugin_id)
-            decl = self._pref_decls.contributions[plugin_id]
-            save_method = getattr(plugin, decl.saving_method)
-            prefs[plugin_id] = save_method()
+            # Do not start plugins only to save their preferences, instead use
+            # the values known for them.
+            methods = self._get_pref_methods(plugin_id, force_create=False)
+            if methods is not None:
+                prefs[plugin_id] = methods[0]()
+            elif plugin_id in stored:
+                prefs[plugin_id] = stored[plugin_id]
+
+        # Flush the auto-saved values and wait for the writer thread so that an
+        # older snapshot cannot replace the file after this write.
+        self._write_auto_saved()
+        self._write_queue.join()
 
         self._last_saved_pref_file = str(path)
+        data = toml.dumps(dictsubtype_as_dict(prefs), pretty=True)
         with open(path, "w", encoding="utf-8") as f:
-            toml.dump(dictsubtype_as_dict(prefs), f, pretty=True)
+            f.write(data)
 
     def load_preferences(self, path: Optional[str] = None) -> None:
         """Load preferences and update all registered plugin.
@@ -116,22 +137,22 @@ class PrefPlugin(Plugin):
 
         """
         if path is None:
-            path = os.path.join(self.app_directory, "preferences", "default.toml")
+            path = self._default_pref_file
 
-        if not os.path.isfile(path):
+        try:
+            with open(path) as f:
+                prefs = toml.load(f)
+        except FileNotFoundError:
             return
 
-        with open(path) as f:
-            prefs = toml.load(f)
         self._prefs |= prefs
         # FIXME need a custom way to merge dict (move from errors to some utils)
-        for plugin_id in prefs:
-            if plugin_id in self._pref_decls.contributions:
-                plugin = self.workbench.get_plugin(plugin_id, force_create=False)
-                if plugin:
-                    decl = self._pref_decls.contributions[plugin_id]
-                    load_method = getattr(plugin, decl.loading_method)
-                    load_method(prefs[plugin_id])
+        decls = self._pref_decls.contributions
+        for plugin_id, plugin_prefs in prefs.items():
+            if plugin_id in decls:
+                methods = self._get_pref_methods(plugin_id, force_create=False)
+                if methods:
+                    methods[1](plugin_prefs)
 
     def plugin_init_complete(self, plugin_id: str) -> None:
         """Notify the preference plugin that a plugin has started properly.
@@ -148,11 +169,10 @@ class PrefPlugin(Plugin):
         """
         plugin = self.workbench.get_plugin(plugin_id)
         pref_decl = self._pref_decls.contributions[plugin_id]
+        # A single observer is shared by all the auto-saved members of all the
+        # plugins, the plugin id being retrieved from the plugin manifest.
         for member in pref_decl.auto_save:
-            # Custom observer which does not rely on the fact that the object
-            # in the change dictionary is a plugin
-            observer = partial(self._auto_save_update, plugin_id)
-            plugin.observe(member, observer)
+            plugin.observe(member, self._auto_save_update)
 
     def get_plugin_preferences(self, plugin_id: str) -> Mapping[str, Any]:
         """Access to the preferences values stored for a plugin.
@@ -172,10 +192,7 @@ class PrefPlugin(Plugin):
             msg = "Plugin %s is not registered in the preferences system"
             raise KeyError(msg % plugin_id)
 
-        if plugin_id in self._prefs:
-            return self._prefs.get(plugin_id, dict())
-
-        return {}
+        return self._prefs.get(plugin_id, {})
 
     def open_editor(self):
         """"""
@@ -190,30 +207,156 @@ class PrefPlugin(Plugin):
     #: Path to the last used preference file
     _last_saved_pref_file = Str()
 
-    #: Ordered dict in which the preferences are stored
+    #: Path to the default preference file, computed at startup.
+    _default_pref_file = Str()
+
+    #: Flag indicating that auto-saved values have not yet been written.
+    _auto_save_pending = Bool()
+
+    #: Dict in which the preferences are stored
     _prefs = Dict(str)
 
     #: Mapping between plugin_id and the declared preferences.
     _pref_decls = Typed(ExtensionsCollector)
 
-    def _auto_save_update(self, plugin_id: str, change: Mapping[str, Any]) -> None:
-        """Observer for the auto-save members
+    #: Queue through which preferences snapshots are sent to the writer thread.
+    _write_queue = Typed(queue.Queue)
+
+    #: Thread writing the auto-saved preferences to the disk.
+    _writer = Typed(Thread)
+
+    #: Mapping between plugin_id and the bound saving and loading methods of the
+    #: plugin. Cleared each time the preferences declarations change.
+    _pref_methods = Dict()
+
+    def _bootstrap_location(self, storage_path: pathlib.Path) -> None:
+        """Create the location file pointing to the default app directory.
+
+        The default directory is the one proposed to the user by the startup
+        sequence, ie a folder named after the application in the user home.
+
+        """
+        app_path = pathlib.Path.home() / self.manifest.application_name
+        app_path.mkdir(parents=True, exist_ok=True)
+        storage_path.write_text(
+            toml.dumps({"app_path": str(app_path)}), encoding="utf-8"
+        )
+
+    def _get_pref_methods(
+        self, plugin_id: str, force_create: bool = True
+    ) -> Optional[Tuple[Callable, Callable]]:
+        """Get the saving and loading methods of a plugin.
 
         Parameters
         ----------
         plugin_id : str
-            Id of the plugin owner of the member being observed
+            Id of the plugin whose methods should be returned.
+
+        force_create : bool, optional
+            Whether to create the plugin if it does not exist yet.
+
+        Returns
+        -------
+        methods : tuple | None
+            Bound saving and loading methods or None if the plugin does not
+            exist and force_create is False.
 
+        """
+        methods = self._pref_methods.get(plugin_id)
+        if methods is None:
+            plugin = self.workbench.get_plugin(plugin_id, force_create=force_create)
+            if plugin is None:
+                return None
+            decl = self._pref_decls.contributions[plugin_id]
+            methods = (
+                getattr(plugin, decl.saving_method),
+                getattr(plugin, decl.loading_method),
+            )
+            self._pref_methods[plugin_id] = methods
+
+        return methods
+
+    def _clear_pref_methods(self, change: Mapping[str, Any]) -> None:
+        """Discard the cached methods when the declarations change."""
+        self._pref_methods.clear()
+
+    def _auto_save_update(self, change: Mapping[str, Any]) -> None:
+        """Observer for the auto-save members
+
+        Parameters
+        ----------
         change : dict
-            Change dictionnary given by Atom
+            Change dictionnary given by Atom, the object being the plugin owning
+            the member.
 
         """
+        plugin_id = change["object"].manifest.id
         name = change["name"]
         value = change["value"]
-        if plugin_id in self._prefs:
-            self._prefs[plugin_id][name] = value
+        plugin_prefs = self._prefs.get(plugin_id)
+        if plugin_prefs is not None:
+            plugin_prefs[name] = value
         else:
             self._prefs[plugin_id] = {name: value}
 
-        with open(self._last_saved_pref_file, "w") as f:
-            toml.dump(dictsubtype_as_dict(self._prefs), f, pretty=True)
+        # Coalesce the writes triggered by changes happening in a burst.
+        if not self._auto_save_pending:
+            self._auto_save_pending = True
+            if Application.instance() is None:
+                self._write_auto_saved()
+            else:
+                deferred_call(self._write_auto_saved)
+
+    def _write_auto_saved(self) -> None:
+        """Send the preferences to the writer thread if an update is pending.
+
+        A snapshot of the preferences is taken so that the writer thread never
+        accesses data that can be modified concurrently.
+
+        """
+        if not self._auto_save_pending:
+            return
+        self._auto_save_pending = False
+        self._write_queue.put(
+            (self._last_saved_pref_file, dictsubtype_as_dict(self._prefs))
+        )
+
+    def _writer_loop(self) -> None:
+        """Write the preferences snapshots sent through the write queue.
+
+        Only the most recent of the queued snapshots is written. The preferences
+        are serialized in memory, written at once to a temporary file and synced
+        to disk before replacing the original so that the file is never left
+        half written. The loop exits when None is received.
+
+        """
+        write_queue = self._write_queue
+        while True:
+            items = [write_queue.get()]
+            while True:
+                try:
+                    items.append(write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            snapshots = [item for item in items if item is not None]
+            try:
+                if snapshots:
+                    path, prefs = snapshots[-1]
+                    tmp_path = path + ".tmp"
+                    data = toml.dumps(prefs, pretty=True).encode("utf-8")
+                    with open(tmp_path, "wb") as f:
+                        f.write(data)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, path)
+            except Exception:
+                logger.exception("Failed to write the preferences to %s", path)
+            finally:
+                # Mark the items as processed only once written, so that
+                # save_preferences can wait for the pending writes.
+                for _ in items:
+                    write_queue.task_done()
+
+            if None in items:
+                return
@@ -8,7 +8,7 @@
 """Declarative class for defining hnadling of preferences.
 
 """
-from atom.api import List, Property, Str
+from atom.api import List, Property, Str, Value
 from enaml.core.api import Declarative, d_, d_func
 from enaml.widgets.container import Container
 from enaml.workbench.api import PluginManifest, Workbench
@@ -22,7 +22,8 @@ class Preferences(Declarative):
 
     """
 
-    #: Id of the contribution. This MUST match the declaring plugin.
+    #: Id of the contribution. This MUST match the declaring plugin. The value
+    #: is cached once computed and reset when the parent changes.
     id = d_(Property(), writable=False, final=True)
 
     #: Short description of what is expected to be saved.
@@ -65,10 +66,21 @@ class Preferences(Declarative):
         """
         pass
 
+    def parent_changed(self, old, new) -> None:
+        """Discard the cached id when the object is reparented."""
+        super(Preferences, self).parent_changed(old, new)
+        self._cached_id = None
+
     # --- Private API
 
+    #: Id of the declaring plugin, computed on first access.
+    _cached_id = Value()
+
     def _get_id(self) -> str:
-        parent = self.parent
-        while not isinstance(parent, PluginManifest):
-            parent = parent.parent
-        return parent.id
+        cached = self._cached_id
+        if cached is None:
+            parent = self.parent
+            while not isinstance(parent, PluginManifest):
+                parent = parent.parent
+            cached = self._cached_id = parent.id
+        return cached
@@ -8,11 +8,10 @@
 """State sharing between plugin (pendant of command plugin).
 
 """
-import enaml
+from gild.utils import make_lazy_getattr
 
 from .state import State
 
-with enaml.imports():
-    from .manifest import StateManifest
+__getattr__ = make_lazy_getattr(__name__, {"StateManifest": ".manifest"})
 
 __all__ = ["State", "StateManifest"]
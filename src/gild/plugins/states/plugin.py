@@ -8,10 +8,10 @@
 """State plugin definition.
 
 """
-import contextlib
-from typing import Any, Iterator, Mapping, Tuple
+from typing import Any, Mapping, Tuple
 
 from atom.api import Atom, Bool, Dict, Typed, Value
+from enaml.application import Application, deferred_call
 from enaml.workbench.api import Plugin
 
 from gild.utils.plugin_tools import ExtensionsCollector
@@ -30,33 +30,23 @@ class _StateHolder(Atom):
     #: Is the plugin linked to this state alive or not.
     alive = Bool(True)
 
-    #: Private flag allowing to block manual update of the state.
-    _allow_set = Bool(False)
-
     # We cannot use Atom.freeze here since Atom does not expose an unfreeze
     def __setattr__(self, name, value):
-        if self._allow_set or name == "_allow_set":
-            super(_StateHolder, self).__setattr__(name, value)
-        else:
-            raise AttributeError("Attributes of states holder are read-only")
-
-    @contextlib.contextmanager
-    def _setting_allowed(self) -> Iterator[None]:
-        """Context manager to prevent users of the state to corrupt it.
+        raise AttributeError("Attributes of states holder are read-only")
 
-        Only the plugin using the state should ever use this context manager.
+    def _set_one(self, name: str, value: Any) -> None:
+        """Set a single member, bypassing the read-only protection."""
+        # Calling Atom.__setattr__ directly skips the read-only protection.
+        Atom.__setattr__(self, name, value)
 
-        """
-        self._allow_set = True
-        try:
-            yield
-        finally:
-            self._allow_set = False
+    def _update_many(self, values: Mapping[str, Any]) -> None:
+        """Set multiple members at once, bypassing the read-only protection."""
+        for name, value in values.items():
+            Atom.__setattr__(self, name, value)
 
     def _updater(self, changes: Mapping[str, Any]) -> None:
         """Observer handler keeping the state up to date with the plugin."""
-        with self._setting_allowed():
-            setattr(self, changes["name"], changes["value"])
+        self._set_one(changes["name"], changes["value"])
 
 
 STATE_POINT = "gild.states.state"
@@ -65,6 +55,11 @@ STATE_POINT = "gild.states.state"
 class StatePlugin(Plugin):
     """A plugin to manage application wide available states."""
 
+    #: Whether to create the classes of the declared states once the event loop
+    #: is idle after starting, rather than on first access to each state. The
+    #: states themselves are still built lazily so that no plugin is started.
+    prewarm = Bool(True)
+
     def start(self) -> None:
         """Start the plugin life-cycle."""
 
@@ -82,6 +77,9 @@ class StatePlugin(Plugin):
         self._states.observe("contributions", self._notify_states_death)
         self._states.start()
 
+        if self.prewarm and Application.instance() is not None:
+            deferred_call(self._prewarm)
+
     def stop(self) -> None:
         """Stop the plugin life-cycle.
 
@@ -91,14 +89,16 @@ class StatePlugin(Plugin):
         """
         self._states.unobserve("contributions", self._notify_states_death)
         self._states.stop()
+        self._state_classes.clear()
 
     def get_state(self, state_id: str) -> _StateHolder:
         """Return the state associated to the given id."""
-        if state_id not in self._living_states:
-            state_obj = self._build_state(state_id)
-            self._living_states[state_id] = state_obj
+        states = self._living_states
+        state_obj = states.get(state_id)
+        if state_obj is None:
+            state_obj = states[state_id] = self._build_state(state_id)
 
-        return self._living_states[state_id]
+        return state_obj
 
     # =========================================================================
     # --- Private API ---------------------------------------------------------
@@ -110,6 +110,10 @@ class StatePlugin(Plugin):
     #: Dictionary keeping track of created and live states objects.
     _living_states = Dict()
 
+    #: Cache of the state holder classes created at runtime, indexed by the state
+    #: id and the synchronized members.
+    _state_classes = Dict()
+
     def _build_state(self, state_id: str) -> _StateHolder:
         """Create a custom _StateHolder class at runtime and instantiate it.
 
@@ -126,27 +130,44 @@ class StatePlugin(Plugin):
 
         """
         state = self._states.contributions[state_id]
-
-        # Create the class name
-        class_name = "".join([s.capitalize() for s in state_id.split(".")])
-
-        members = {}
-        for m in state.sync_members:
-            members[m] = Value()
-        state_class = type(class_name, (_StateHolder,), members)
+        state_class = self._get_state_class(state_id, state)
 
         # Instantiation , initialisation, and binding of the state object to
         # the plugin declaring it.
         state_object = state_class()
         extension = self._states.contributed_by(state_id)
         plugin = self.workbench.get_plugin(extension.plugin_id)
-        with state_object._setting_allowed():
-            for m in state.sync_members:
-                setattr(state_object, m, getattr(plugin, m))
-            plugin.observe(m, state_object._updater)
+        sync_members = tuple(state.sync_members)
+        state_object._update_many({m: getattr(plugin, m) for m in sync_members})
+        plugin.observe(sync_members, state_object._updater)
 
         return state_object
 
+    def _get_state_class(self, state_id: str, state: State) -> type:
+        """Get the _StateHolder subclass to use for a state, creating it if needed.
+
+        The class created for a previous instance of the state is reused if the
+        synchronized members did not change.
+
+        """
+        key = (state_id, tuple(state.sync_members))
+        state_class = self._state_classes.get(key)
+        if state_class is None:
+            # Create the class name
+            class_name = "".join([s.capitalize() for s in state_id.split(".")])
+            # Each member needs its own instance since Atom renames the members
+            # when building a class.
+            members = {m: Value() for m in state.sync_members}
+            state_class = type(class_name, (_StateHolder,), members)
+            self._state_classes[key] = state_class
+
+        return state_class
+
+    def _prewarm(self) -> None:
+        """Create the classes of all the currently declared states."""
+        for state_id, state in list(self._states.contributions.items()):
+            self._get_state_class(state_id, state)
+
     def _notify_states_death(self, change: Mapping[str, Any]) -> None:
         """Notify that the plugin contributing a state is not plugged anymore.
 
@@ -154,10 +175,8 @@ class StatePlugin(Plugin):
 
         """
         if "oldvalue" in change:
-            deads = set(change["oldvalue"]) - set(change["value"])
+            deads = change["oldvalue"].keys() - change["value"].keys()
             for dead in deads:
-                if dead in self._living_states:
-                    state = self._living_states[dead]
-                    with state._setting_allowed():
-                        state.alive = False
-                    del self._living_states[dead]
+                state = self._living_states.pop(dead, None)
+                if state is not None:
+                    state._set_one("alive", False)
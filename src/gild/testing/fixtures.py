@@ -16,7 +16,7 @@ import rtoml as toml
 from enaml.qt.qt_application import QtApplication
 from enaml.workbench.api import Workbench
 
-from .util import close_all_popups, close_all_windows
+from .util import close_all_ui
 
 #: Global variable storing the application folder path
 APP_FOLDER = ""
@@ -44,7 +44,7 @@ def pytest_configure(config):
         DIALOG_SLEEP = s * 1000
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dialog_sleep():
     """Return the time to sleep as set by the --gild-sleep option."""
     return DIALOG_SLEEP
@@ -54,43 +54,45 @@ def dialog_sleep():
 def app():
     """Make sure a QtApplication is active."""
     app = QtApplication.instance()
-    if app is None:
+    owned = app is None
+    if owned:
         app = QtApplication()
-        yield app
+    yield app
+    # Only stop an application this fixture created.
+    if owned:
         app.stop()
-    else:
-        yield app
 
 
 @pytest.fixture
 def gild_qtbot(app, qtbot):
     """Set the enaml application on the bot and add automatic windows cleanup."""
     qtbot.enaml_app = app
-    with close_all_windows(qtbot), close_all_popups(qtbot):
+    with close_all_ui(qtbot):
         yield qtbot
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app_name() -> str:
     """Name of the application used for testing."""
-    yield "test"
+    return "test"
 
 
 @pytest.fixture
-def app_dir_storage(monkeypatch, tmpdir, app_name: str) -> pathlib.Path:
+def app_dir_storage(monkeypatch, tmp_path, app_name: str) -> pathlib.Path:
     """Path at which the file storing the app dir location is stored."""
-    monkeypatch.setattr(pathlib.Path, "home", lambda: pathlib.Path(str(tmpdir)))
+    monkeypatch.setattr(pathlib.Path, "home", lambda: tmp_path)
 
-    yield pathlib.Path(str(tmpdir), f".{app_name}")
+    yield tmp_path / f".{app_name}"
 
 
 @pytest.fixture
-def app_dir(tmpdir, app_name, app_dir_storage):
+def app_dir(tmp_path, app_name, app_dir_storage):
     """Temporary application directory"""
-    app_dir = pathlib.Path(str(tmpdir)) / "test"
+    app_dir = tmp_path / "test"
     app_dir.mkdir(exist_ok=True, parents=True)
-    with open(app_dir_storage, "w") as f:
-        toml.dump(dict(app_path=str(app_dir)), f)
+    app_dir_storage.write_text(
+        toml.dumps(dict(app_path=str(app_dir))), encoding="utf-8"
+    )
 
     yield app_dir
 
@@ -10,15 +10,16 @@
 """
 import gc
 import inspect
+import sys
 import weakref
-from collections import OrderedDict
 from contextlib import contextmanager
 from pprint import pformat
 
 import enaml
-from atom.api import Atom, Bool
+from atom.api import Atom, Bool, List
 from enaml.application import timed_call
 from enaml.widgets.api import Dialog, PopupView, Window
+from enaml.workbench.api import Workbench
 
 with enaml.imports():
     from enaml.stdlib.message_box import MessageBox
@@ -164,11 +165,8 @@ def close_window_or_popup(qtbot, window_or_popup):
     qtbot.wait_until(obs.assert_called)
 
 
-@contextmanager
-def close_all_windows(qtbot):
-    """Close all opened windows."""
-    yield
-    run_pending_tasks(qtbot)
+def _close_windows(qtbot):
+    """Close all opened windows without running pending tasks first."""
     while Window.windows:
         windows = list(Window.windows)
         # First close non top level windows to avoid a window to lose its
@@ -180,11 +178,8 @@ def close_all_windows(qtbot):
             close_window_or_popup(qtbot, window)
 
 
-@contextmanager
-def close_all_popups(qtbot):
-    """Close all opened popups."""
-    yield
-    run_pending_tasks(qtbot)
+def _close_popups(qtbot):
+    """Close all opened popups without running pending tasks first."""
     while PopupView.popup_views:
         popups = list(PopupView.popup_views)
         # First close non top level popups to avoid a up/window to lose its
@@ -196,6 +191,46 @@ def close_all_popups(qtbot):
             close_window_or_popup(qtbot, popup)
 
 
+@contextmanager
+def close_all_windows(qtbot):
+    """Close all opened windows."""
+    yield
+    run_pending_tasks(qtbot)
+    _close_windows(qtbot)
+
+
+@contextmanager
+def close_all_popups(qtbot):
+    """Close all opened popups."""
+    yield
+    run_pending_tasks(qtbot)
+    _close_popups(qtbot)
+
+
+@contextmanager
+def close_all_ui(qtbot):
+    """Close all opened popups and windows.
+
+    Pending tasks are run only once before closing first the popups and then
+    the windows.
+
+    """
+    yield
+    run_pending_tasks(qtbot)
+    _close_popups(qtbot)
+    _close_windows(qtbot)
+
+
+@contextmanager
+def preserved_std_streams():
+    """Restore sys.stdout and sys.stderr when exiting, even on errors."""
+    stdout, stderr = sys.stdout, sys.stderr
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+
 class ScheduledClosing(object):
     """Scheduled closing of dialog."""
 
@@ -323,7 +358,45 @@ def set_preferences(workbench, preferences):
 
     """
     plugin = workbench.get_plugin("gild.preferences")
-    plugin._prefs = OrderedDict(preferences)
+    plugin._prefs = dict(preferences)
+
+
+class TrackingWorkbench(Workbench):
+    """Workbench keeping track of the ids of the registered manifests.
+
+    It allows to share a workbench between tests while still unregistering the
+    manifests registered by each test.
+
+    """
+
+    #: Ids of the registered manifests in registration order.
+    registered = List()
+
+    def register(self, manifest):
+        super(TrackingWorkbench, self).register(manifest)
+        self.registered.append(manifest.id)
+
+    def unregister(self, plugin_id):
+        super(TrackingWorkbench, self).unregister(plugin_id)
+        if plugin_id in self.registered:
+            self.registered.remove(plugin_id)
+
+    @contextmanager
+    def registration_scope(self):
+        """Unregister on exit the manifests registered inside the context.
+
+        The manifests are unregistered in registration order so that a plugin
+        which registered other manifests can unregister them when it stops.
+
+        """
+        known = set(self.registered)
+        try:
+            yield self
+        finally:
+            added = [m_id for m_id in self.registered if m_id not in known]
+            for manifest_id in added:
+                if manifest_id in self.registered:
+                    self.unregister(manifest_id)
 
 
 class ErrorDialogException(Exception):
@@ -9,11 +9,60 @@
 """Utility tools for handling preferences and declaring plugin extensions.
 
 """
-from typing import Any
+import importlib
+import importlib.metadata
+import sys
+from typing import Any, Callable, Iterable, Mapping
 
 from enaml.workbench.api import Workbench
 
 
+def iter_entry_points(group: str) -> Iterable[importlib.metadata.EntryPoint]:
+    """Get the entry points registered for a group.
+
+    Selecting the group avoids building the entry points of all the groups.
+
+    """
+    if sys.version_info >= (3, 10):
+        return importlib.metadata.entry_points(group=group)
+    return importlib.metadata.entry_points().get(group, ())
+
+
+def make_lazy_getattr(
+    package: str, lazy_objects: Mapping[str, str]
+) -> Callable[[str], Any]:
+    """Create a module __getattr__ importing enaml objects on first access.
+
+    Deferring the import of the manifests avoids compiling the enaml files
+    when only the Python parts of a package are used.
+
+    Parameters
+    ----------
+    package : str
+        Name of the package whose attributes are lazily imported.
+
+    lazy_objects : Mapping[str, str]
+        Mapping between the name of the attributes and the relative name of the
+        enaml module defining them.
+
+    """
+
+    def __getattr__(name: str) -> Any:
+        """Import the object only when it is first accessed."""
+        if name in lazy_objects:
+            import enaml
+
+            with enaml.imports():
+                module = importlib.import_module(lazy_objects[name], package)
+
+            obj = getattr(module, name)
+            setattr(sys.modules[package], name, obj)
+            return obj
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
+
+
 # FIXME
 def invoke_command(
     workbench: Workbench, cmd: str, parameters: dict, trigger: Any = None
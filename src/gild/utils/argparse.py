@@ -8,13 +8,15 @@
 """Tools to build cmdline argument parsers extensible by application plugins.
 
 """
+import importlib.metadata
 from argparse import ArgumentParser
 from operator import itemgetter
 from traceback import format_exc
-from typing import Any, Callable, Mapping, Optional
+from typing import Any, Callable, Dict as TDict, List as TList, Mapping, Optional, Tuple
 
-from atom.api import Atom, Dict, List, Str, Value
-from pkg_resources import iter_entry_points
+from atom.api import Atom, Dict, Str, Value
+
+from . import iter_entry_points
 
 
 class ArgParser(Atom):
@@ -43,10 +45,8 @@ class ArgParser(Atom):
         parsed = self._parser.parse_args(args)
 
         # Resolve choices.
-        mapping = self._arg_to_choices
-        for k, v in vars(parsed).items():
-            if k in mapping:
-                setattr(parsed, k, mapping[k][v])
+        for k, choices in self._choices_to_resolve:
+            setattr(parsed, k, choices[getattr(parsed, k)])
 
         return parsed
 
@@ -60,10 +60,13 @@ class ArgParser(Atom):
         if not args[0].startswith("-"):
             raise ValueError(f"Only optional arguments can be added to {self.app_name}")
 
-        if len(args) == 1:
-            arg_name = args[0].strip("--")
-        else:
-            arg_name = args[1].strip("--")
+        # Compute the name of the attribute in which argparse stores the value.
+        arg_name = kwargs.get("dest") or (
+            (args[1] if len(args) > 1 else args[0])
+            .removeprefix("--")
+            .removeprefix("-")
+            .replace("-", "_")
+        )
 
         if "choices" in kwargs and kwargs["choices"] in self.choices:
             kwargs["choices"] = self.choices[kwargs["choices"]]
@@ -102,12 +105,17 @@ class ArgParser(Atom):
     # _init_parser, or parser provided by the parent parser.
     _parser = Value()
 
-    # List of tuple to use to create arguments.
-    _arguments = List()
+    # List of tuple to use to create arguments. Plain containers are used for
+    # the private build state since it does not need any validation.
+    _arguments = Value(factory=list)
 
     #: Mapping between argument and associated choices.
     #: Used to resolve choices.
-    _arg_to_choices = Dict()
+    _arg_to_choices = Value(factory=dict)
+
+    #: Pairs of argument and associated choices built when creating the parser
+    #: so that only the arguments using choices are visited when parsing.
+    _choices_to_resolve = Value(factory=list)
 
     def _init_parser(self) -> None:
         """Initialize the underlying argparse.ArgumentParser."""
@@ -117,6 +125,15 @@ class ArgParser(Atom):
         for args, kwargs in self._arguments:
             self._parser.add_argument(*args, **kwargs)
 
+        self._choices_to_resolve = list(self._arg_to_choices.items())
+
+
+#: Cache of the modifiers loaded from each entry point group. Each modifier is
+#: stored as a tuple (entry point, modifier, priority, index).
+_MODIFIERS_CACHE: TDict[
+    str, TList[Tuple[importlib.metadata.EntryPoint, Callable, int, int]]
+] = {}
+
 
 def extend_parser(
     parser: ArgParser,
@@ -135,25 +152,35 @@ def extend_parser(
         Callable used to handle errors. The callable gets an error title, a
         short summary, a detailed report and the exception itself.
 
+    Successfully loaded entry points are cached so that extending a parser
+    again does not scan the installed distributions.
+
     """
-    modifiers = []
-    for i, ep in enumerate(iter_entry_points(entry_point)):
-        try:
-            modifier, priority = ep.load(require=False)
-            modifiers.append((ep, modifier, priority, i))
-        except Exception as e:
-            title = "Error loading extension %s" % ep.name
-            content = (
-                "The following error occurred when trying to load the "
-                "entry point {} :\n {}".format(ep.name, e)
-            )
-            details = format_exc()
-            handle_error(title, content, details, e)
-
-    modifiers.sort(key=itemgetter(1, 2))
+    modifiers = _MODIFIERS_CACHE.get(entry_point)
+    if modifiers is None:
+        modifiers = []
+        failed = False
+        for i, ep in enumerate(iter_entry_points(entry_point)):
+            try:
+                modifier, priority = ep.load()
+                modifiers.append((ep, modifier, priority, i))
+            except Exception as e:
+                failed = True
+                title = "Error loading extension %s" % ep.name
+                content = (
+                    "The following error occurred when trying to load the "
+                    "entry point {} :\n {}".format(ep.name, e)
+                )
+                details = format_exc()
+                handle_error(title, content, details, e)
+        modifiers.sort(key=itemgetter(2, 3))
+        # Do not cache partial results so that errors are reported again.
+        if not failed:
+            _MODIFIERS_CACHE[entry_point] = modifiers
+
     try:
-        for m in modifiers:
-            m[1](parser)
+        for ep, modifier, _, _ in modifiers:
+            modifier(parser)
     except Exception as e:
         title = "Error modifying cmd line arguments"
         content = (
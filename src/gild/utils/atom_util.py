@@ -9,12 +9,28 @@
 """Tools to work with Atom tagged members and to automatize preferences handling.
 
 """
-from collections import OrderedDict
+from functools import lru_cache
 from inspect import cleandoc, getfullargspec
 from textwrap import fill
-from typing import Any, Dict, Optional
-
-from atom.api import Atom, Constant, Member
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from atom.api import (
+    Atom,
+    Bool,
+    Bytes,
+    Constant,
+    Enum,
+    Float,
+    FloatRange,
+    Int,
+    List,
+    Member,
+    Range,
+    Set,
+    Str,
+    Tuple,
+)
 
 # String identifying the preference tag
 PREF_KEY = "pref"
@@ -23,12 +39,59 @@ PREF_KEY = "pref"
 TO_PREF_ID = 0
 FROM_PREF_ID = 1
 
+# Error messages used when the pref tag of a member is invalid.
+_PREF_FALSE_MSG = fill(
+    cleandoc(
+        """you set "pref=False" for this member. If you did
+    not want to save it you should simply not declare this tag."""
+    )
+)
+
+_PREF_MISSING_FUNCS_MSG = fill(
+    cleandoc(
+        """the "pref" tag of this member was not set to true,
+    therefore the program expects you to declare two functions,
+     "member_to_pref(obj,member,val)" and "member_from_pref(obj,member,
+     val)" that will handle the serialization and deserialization of
+     the value. Those should be passed as a list or a tuple, where
+     the first element is member_to and the second is member_from.
+     It is possible that you failed to properly declare the signature
+     of those two functions."""
+    )
+)
+
+
+#: Sentinel used to identify missing metadata.
+_MISSING = object()
+
+#: Cache of the tagged members of Atom classes keyed by (class, meta, meta_value).
+_TAGGED_CACHE: Dict[tuple, Mapping[str, Member]] = {}
+
+
+def _compute_tagged(
+    cls: type, meta: str, meta_value: Any = None
+) -> Mapping[str, Member]:
+    """Filter the members of an Atom class based on their metadata."""
+    tagged = {}
+    for key, member in cls.members().items():
+        metadata = member.metadata
+        if metadata is None:
+            continue
+        value = metadata.get(meta, _MISSING)
+        if value is not _MISSING and (meta_value is None or value == meta_value):
+            tagged[key] = member
+    return MappingProxyType(tagged)
+
 
 def tagged_members(
     obj: Atom, meta: Optional[str] = None, meta_value: Any = None
-) -> Dict[str, Member]:
+) -> Mapping[str, Member]:
     """Utility function to retrieve tagged members from an object
 
+    The results are cached per class, since members are defined when the
+    class is created. Use clear_caches() if the metadata of a member is
+    modified afterwards.
+
     Parameters
     ----------
     obj : Atom
@@ -42,27 +105,29 @@ def tagged_members(
 
     Returns
     -------
-    tagged_members : dict(str, Member)
-        Dictionary of the members whose metadatas corresponds to the predicate
+    tagged_members : Mapping(str, Member)
+        Read-only mapping of the members whose metadatas corresponds to the predicate
 
     """
-    members = obj.members()
     if meta is None and meta_value is None:
-        return members
-    elif meta_value is None:
-        return {
-            key: member
-            for key, member in members.items()
-            if member.metadata is not None and meta in member.metadata
-        }
-    else:
-        return {
-            key: member
-            for key, member in members.items()
-            if member.metadata is not None
-            and meta in member.metadata
-            and member.metadata[meta] == meta_value
-        }
+        return obj.members()
+
+    cls = type(obj)
+    key = (cls, meta, meta_value)
+    try:
+        tagged = _TAGGED_CACHE.get(key)
+    except TypeError:
+        # Unhashable metadata value, filter without caching.
+        return _compute_tagged(cls, meta, meta_value)
+    if tagged is None:
+        tagged = _TAGGED_CACHE[key] = _compute_tagged(cls, meta, meta_value)
+    return tagged
+
+
+@lru_cache(maxsize=None)
+def _argcount(func: Any) -> int:
+    """Get the number of positional arguments of a converter function."""
+    return len(getfullargspec(func)[0])
 
 
 def member_from_pref(obj: Atom, member: Member, val: Any) -> Any:
@@ -100,39 +165,19 @@ def member_from_pref(obj: Atom, member: Member, val: Any) -> Any:
         if converter is None:
             # Serialization required care, deserialization does not.
             value = val
-        elif len(getfullargspec(converter)[0]) == 3:
+        elif _argcount(converter) == 3:
             value = meta_value[FROM_PREF_ID](obj, member, val)
         else:
             raise ValueError(
                 "The converter from preference value to member "
                 "value is expected to take 3 parameters, the provided function "
-                f"takes {len(getfullargspec(converter)[0])}."
+                f"takes {_argcount(converter)}."
             )
 
     elif meta_value is False:
-        raise NotImplementedError(
-            fill(
-                cleandoc(
-                    """you set "pref=False" for this member. If you did
-            not want to save it you should simply not declare this tag."""
-                )
-            )
-        )
+        raise NotImplementedError(_PREF_FALSE_MSG)
     else:
-        raise NotImplementedError(
-            fill(
-                cleandoc(
-                    """the "pref" tag of this member was not set to true,
-            therefore the program expects you to declare two functions,
-             "member_to_pref(obj,member,val)" and "member_from_pref(obj,member,
-             val)" that will handle the serialization and deserialization of
-             the value. Those should be passed as a list or a tuple, where
-             the first element is member_to and the second is member_from.
-             It is possible that you failed to properly declare the signature
-             of those two functions."""
-                )
-            )
-        )
+        raise NotImplementedError(_PREF_MISSING_FUNCS_MSG)
 
     return value
 
@@ -168,34 +213,14 @@ def member_to_pref(obj: Atom, member: Member, val: Any) -> Any:
     elif (
         isinstance(meta_value, (tuple, list))
         and len(meta_value) == 2
-        and len(getfullargspec(meta_value[TO_PREF_ID])[0]) == 3
+        and _argcount(meta_value[TO_PREF_ID]) == 3
     ):
         pref_value = meta_value[TO_PREF_ID](obj, member, val)
 
     elif meta_value is False:
-        raise NotImplementedError(
-            fill(
-                cleandoc(
-                    """you set "pref=False" for this member. If you did
-            not want to save it you should simply not declare this tag."""
-                )
-            )
-        )
+        raise NotImplementedError(_PREF_FALSE_MSG)
     else:
-        raise NotImplementedError(
-            fill(
-                cleandoc(
-                    """the "pref" tag of this member was not set to true,
-            therefore the program expects you to declare two functions,
-             "member_to_pref(obj,member,val)" and "member_from_pref(obj,member,
-             val)" that will handle the serialization and deserialization of
-             the value. Those should be passed as a list or a tuple, where
-             the first element is member_to and the second is member_from.
-             It is possible that you failed to properly declare the signature
-             of those two functions."""
-                )
-            )
-        )
+        raise NotImplementedError(_PREF_MISSING_FUNCS_MSG)
 
     return pref_value
 
@@ -211,15 +236,102 @@ class HasPrefAtom(Atom):
     pass
 
 
-def preferences_from_members(self: Atom) -> OrderedDict:
+#: Preferences handling plan of Atom classes, see _get_pref_plan.
+_PREF_PLANS: Dict[type, tuple] = {}
+
+
+#: Members whose values can never be HasPrefAtom instances.
+_SCALAR_MEMBERS = (
+    Bool,
+    Bytes,
+    Enum,
+    Float,
+    FloatRange,
+    Int,
+    List,
+    Range,
+    Set,
+    Str,
+    Tuple,
+)
+
+
+def _may_hold_pref_atom(member: Member) -> bool:
+    """Check whether the value of a member can be a HasPrefAtom."""
+    # Typed, Instance and Value members are checked at runtime since the value
+    # may use HasPrefAtom as a mixin of an unrelated declared type.
+    return not isinstance(member, _SCALAR_MEMBERS)
+
+
+def _get_pref_plan(cls: type) -> dict:
+    """Get the precomputed preferences handling of the members of a class.
+
+    The plan maps each member name, in declaration order, to a tuple (member,
+    is_constant, maybe_nested, to_pref, from_pref) where maybe_nested is False
+    when the member value can never be a HasPrefAtom and the converters are
+    None when the value is used as is.
+    Invalid declarations use member_to_pref/member_from_pref as converters so
+    that the usual errors are raised when the member is actually converted.
+
+    """
+    plan = _PREF_PLANS.get(cls)
+    if plan is not None:
+        return plan
+
+    plan = {}
+    for name, member in _compute_tagged(cls, PREF_KEY).items():
+        meta_value = member.metadata[PREF_KEY]
+        to_pref = member_to_pref
+        from_pref = member_from_pref
+        if meta_value is True:
+            to_pref = from_pref = None
+        elif isinstance(meta_value, (tuple, list)) and len(meta_value) == 2:
+            to_conv, from_conv = meta_value[TO_PREF_ID], meta_value[FROM_PREF_ID]
+            try:
+                if _argcount(to_conv) == 3:
+                    to_pref = to_conv
+            except TypeError:
+                pass
+            if from_conv is None:
+                from_pref = None
+            else:
+                try:
+                    if _argcount(from_conv) == 3:
+                        from_pref = from_conv
+                except TypeError:
+                    pass
+        is_constant = isinstance(member, Constant)
+        maybe_nested = _may_hold_pref_atom(member)
+        plan[name] = (member, is_constant, maybe_nested, to_pref, from_pref)
+
+    _PREF_PLANS[cls] = plan
+    return plan
+
+
+def clear_caches() -> None:
+    """Discard the cached tagged members, converters signatures and plans.
+
+    This should be called if the metadata of a member is modified after the
+    creation of its class.
+
+    """
+    _TAGGED_CACHE.clear()
+    _PREF_PLANS.clear()
+    _argcount.cache_clear()
+
+
+def preferences_from_members(self: Atom) -> dict:
     """Get the members values as string to store them in .ini files."""
-    pref = OrderedDict()
-    for name, member in tagged_members(self, "pref").items():
+    pref = {}
+    plan = _get_pref_plan(type(self))
+    for name, (member, _, maybe_nested, to_pref, _) in plan.items():
         old_val = getattr(self, name)
-        if issubclass(type(old_val), HasPrefAtom):
+        if maybe_nested and isinstance(old_val, HasPrefAtom):
             pref[name] = old_val.preferences_from_members()
+        elif to_pref is None:
+            pref[name] = old_val
         else:
-            pref[name] = member_to_pref(self, member, old_val)
+            pref[name] = to_pref(self, member, old_val)
     return pref
 
 
@@ -229,21 +341,28 @@ def update_members_from_preferences(self: Atom, parameters: dict) -> None:
     This function will call itself on any tagged HasPrefAtom member.
 
     """
-    for name, member in tagged_members(self, "pref").items():
+    plan = _get_pref_plan(type(self))
+    for name, value in parameters.items():
+        entry = plan.get(name)
+        if entry is None:
+            continue
 
-        if name not in parameters or isinstance(member, Constant):
+        member, is_constant, maybe_nested, _, from_pref = entry
+        if is_constant:
             continue
 
         old_val = getattr(self, name)
-        if issubclass(type(old_val), HasPrefAtom):
-            old_val.update_members_from_preferences(parameters[name])
+        if maybe_nested and isinstance(old_val, HasPrefAtom):
+            old_val.update_members_from_preferences(value)
         # This is meant to prevent updating fields which expect a custom
         # instance
         elif old_val is None:
             pass
         else:
-            value = parameters[name]
-            converted = member_from_pref(self, member, value)
+            if from_pref is None:
+                converted = value
+            else:
+                converted = from_pref(self, member, value)
             try:
                 setattr(self, name, converted)
             except Exception as e:
@@ -9,9 +9,10 @@
 
 """
 import re
+import sys
 from importlib import import_module
 from traceback import format_exc
-from typing import Any, MutableMapping, Optional
+from typing import Any, Dict, MutableMapping, Optional, Tuple
 
 from atom.api import Bool, Str
 from enaml.core.api import Declarative, d_
@@ -36,20 +37,23 @@ class Declarator(Declarative):
             declared.
 
         """
-        if isinstance(self.parent, Declarator):
-            return self.parent.get_path()
+        node = self.parent
+        while isinstance(node, Declarator):
+            if isinstance(node, GroupDeclarator):
+                return node.get_path()
+            node = node.parent
         return None
 
     def get_group(self) -> Optional[str]:
         """Get the group defined by the closest parent."""
-        if not isinstance(self.parent, Declarator):
-            return None
+        node = self.parent
+        while isinstance(node, Declarator):
+            group = getattr(node, "group", None)
+            if group:
+                return group
+            node = node.parent
 
-        group = getattr(self.parent, "group", None)
-        if group:
-            return group
-
-        return self.parent.get_group()
+        return None
 
     def register(
         self, collector: DeclaratorCollector, traceback: MutableMapping[str, Any]
@@ -88,8 +92,10 @@ class Declarator(Declarative):
         raise NotImplementedError()
 
 
-#: Valid paths are names which are dot separated.
-PATH_VALIDATOR = re.compile(r"^(\.?\w+)*$")
+#: Valid paths are names which are dot separated. The pattern avoids nested
+#: quantifiers to prevent catastrophic backtracking and must be used with
+#: fullmatch.
+PATH_VALIDATOR = re.compile(r"(?:\.?\w+(?:\.\w+)*)?")
 
 
 class GroupDeclarator(Declarator):
@@ -106,21 +112,20 @@ class GroupDeclarator(Declarator):
     def get_path(self) -> Optional[str]:
         """Overriden method to walk all parents."""
         paths = []
-        if isinstance(self.parent, GroupDeclarator):
-            parent_path = self.parent.get_path()
-            if parent_path:
-                paths.append(parent_path)
-
-        if self.path:
-            paths.append(self.path)
+        node = self
+        while isinstance(node, GroupDeclarator):
+            if node.path:
+                paths.append(node.path)
+            node = node.parent
 
         if paths:
+            paths.reverse()
             return ".".join(paths)
         return None
 
     def register(self, plugin: Plugin, traceback: MutableMapping[str, Any]) -> None:
         """Register all children Declarator."""
-        if not PATH_VALIDATOR.match(self.path):
+        if not PATH_VALIDATOR.fullmatch(self.path):
             msg = "Invalid path {} in {} (path {}, group {})"
             traceback["Error %s" % len(traceback)] = msg.format(
                 self.path, type(self), self.path, self.group
@@ -156,27 +161,41 @@ class GroupDeclarator(Declarator):
         )
 
 
+#: Cache of the objects successfully retrieved by import_and_get.
+_IMPORT_CACHE: Dict[Tuple[str, str], Any] = {}
+
+
 def import_and_get(
     path, name: str, traceback: MutableMapping[str, str], id: str
 ) -> None:
     """Function importing a module and retrieving an object from it.
 
-    This function provides a common pattern for declarator.
+    This function provides a common pattern for declarator. Successfully
+    retrieved objects are cached.
 
     """
-    import enaml
-
-    try:
-        with enaml.imports():
-            mod = import_module(path)
-    except Exception:
-        msg = "Failed to import {} :\n{}"
-        traceback[id] = msg.format(path, format_exc())
-        return
+    key = (path, name)
+    if key in _IMPORT_CACHE:
+        return _IMPORT_CACHE[key]
+
+    # Avoid entering the enaml import hook if the module is already imported.
+    mod = sys.modules.get(path)
+    if mod is None:
+        import enaml
+
+        try:
+            with enaml.imports():
+                mod = import_module(path)
+        except Exception:
+            msg = "Failed to import {} :\n{}"
+            traceback[id] = msg.format(path, format_exc())
+            return
 
     try:
-        return getattr(mod, name)
+        obj = _IMPORT_CACHE[key] = getattr(mod, name)
     except AttributeError:
         msg = "{} has no attribute {}:\n{}"
         traceback[id] = msg.format(path, name, format_exc())
         return
+
+    return obj
@@ -8,16 +8,26 @@
 """Mixin class to provide declarative finalization customisations capabilities.
 
 """
-from typing import Type, TypeVar
+from typing import Dict, Type, TypeVar
 
 from atom.api import Event
 from enaml.core.api import d_
 
 T = TypeVar("T")
 
+#: Cache of the classes created by add_destroy_hook indexed by base class.
+_DESTROYABLE_CLASSES: Dict[type, type] = {}
+
 
 def add_destroy_hook(cls: Type[T]) -> Type[T]:
-    """Add a declarative event signaling that an object will be destroyed."""
+    """Add a declarative event signaling that an object will be destroyed.
+
+    A single subclass is created per base class.
+
+    """
+    cached = _DESTROYABLE_CLASSES.get(cls)
+    if cached is not None:
+        return cached
 
     class Destroyable(cls):  # type: ignore
         """Subclass overriding the destroy method to emit "ended" before
@@ -36,4 +46,5 @@ def add_destroy_hook(cls: Type[T]) -> Type[T]:
             self.ended = True
             super(Destroyable, self).destroy()
 
+    _DESTROYABLE_CLASSES[cls] = Destroyable
     return Destroyable
@@ -9,9 +9,20 @@
 
 """
 from collections import defaultdict
-from typing import Any, Callable as TypedCallable, Iterable, Mapping, Tuple, Union
-
-from atom.api import Atom, Callable, Coerced, Dict, List, Str, Typed
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable as TypedCallable,
+    Dict as TDict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Tuple,
+    Union,
+)
+
+from atom.api import Atom, Callable, Coerced, Dict, Int, List, Str, Typed, Value
 from enaml.workbench.api import Extension, Plugin, Workbench
 from enaml.workbench.core.execution_event import ExecutionEvent
 
@@ -45,6 +56,10 @@ class HasPreferencesPlugin(Plugin):
         )
 
 
+#: Handlers generated by make_handler indexed by plugin id and method name.
+_HANDLER_CACHE: TDict[Tuple[str, str], TypedCallable[[ExecutionEvent], Any]] = {}
+
+
 def make_handler(id: str, method_name: str) -> TypedCallable[[ExecutionEvent], Any]:
     """Generate a generic handler calling a plugin method.
 
@@ -55,17 +70,28 @@ def make_handler(id: str, method_name: str) -> TypedCallable[[ExecutionEvent], A
     method_name : str
         Name of teh method to call.
 
+    Handlers only depend on their arguments and are hence shared between
+    manifests and workbenches.
+
     """
+    key = (id, method_name)
+    cached = _HANDLER_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # Only the attribute lookup is prepared, the plugin is retrieved on each call
+    # since it may be restarted while the manifest is kept.
+    get_method = attrgetter(method_name)
 
     def handler(event: ExecutionEvent) -> Any:
         """Handler getting the method corresponding to the command from the
         plugin.
 
         """
-        pl = event.workbench.get_plugin(id)
-        return getattr(pl, method_name)(**event.parameters)
+        return get_method(event.workbench.get_plugin(id))(**event.parameters)
 
     handler.__name__ += "_" + method_name
+    _HANDLER_CACHE[key] = handler
     return handler
 
 
@@ -95,12 +121,15 @@ def make_extension_validator(
 
     """
 
+    # Resolve the base class functions once rather than for each contribution.
+    fn_names = tuple(fn_names)
+    attributes = tuple(attributes)
+    base_funcs = tuple((name, getattr(base_cls, name)) for name in fn_names)
+
     def validator(contrib: Any) -> Tuple[bool, str]:
         """Validate the children of an extension."""
-        for name in fn_names:
-            member = getattr(contrib, name)
-            func = getattr(member, "__func__", None)
-            o_func = getattr(base_cls, name)
+        for name, o_func in base_funcs:
+            func = getattr(getattr(contrib, name), "__func__", None)
             if not func or func is o_func:
                 msg = f"{base_cls} '{contrib.id}' does not declare a {name} function."
                 return False, msg
@@ -126,8 +155,10 @@ class ClassTuple(tuple):
     """
 
     def __new__(cls, vals: Union[type, Tuple[type]]):
-        if isinstance(vals, type):
-            return tuple.__new__(ClassTuple, [vals])
+        if type(vals) is ClassTuple:
+            return vals
+        elif isinstance(vals, type):
+            return tuple.__new__(ClassTuple, (vals,))
         else:
             return tuple.__new__(ClassTuple, vals)
 
@@ -173,6 +204,7 @@ class BaseCollector(Atom):
         self.unobserve("contributions")  # Dicsonnect all observers
         self.contributions.clear()
         self._extensions.clear()
+        del self._core
 
     # =========================================================================
     # --- Private API ---------------------------------------------------------
@@ -181,6 +213,9 @@ class BaseCollector(Atom):
     #: Private storage keeping track of which extension declared which object.
     _extensions = Typed(defaultdict, (list,))
 
+    #: Reference to the core plugin used to signal errors.
+    _core = Typed(Plugin)
+
     def _refresh_contributions(self) -> None:
         """Refresh the extensions contributions.
 
@@ -216,6 +251,10 @@ class BaseCollector(Atom):
         point = workbench.get_extension_point(self.point)
         point.unobserve("extensions", self._on_contribs_updated)
 
+    def _default__core(self) -> Plugin:
+        """Get the core plugin from the workbench."""
+        return self.workbench.get_plugin("enaml.workbench.core")
+
 
 class ExtensionsCollector(BaseCollector):
     """Convenience class collecting an extension point contribution.
@@ -232,12 +271,16 @@ class ExtensionsCollector(BaseCollector):
     #: went wrong (or an empty string if test passed).
     validate_ext = Callable(lambda e: (True, ""))
 
+    def stop(self) -> None:
+        """Unbind observers and clean up ressources."""
+        super(ExtensionsCollector, self).stop()
+        self._validated.clear()
+        self._contrib_to_ext.clear()
+        self._duplicated_ids.clear()
+
     def contributed_by(self, contrib_id: str) -> Extension:
         """Find the extension declaring a contribution."""
-        contrib = self.contributions[contrib_id]
-        for ext, cs in self._extensions.items():
-            if contrib in cs:
-                return ext
+        return self._contrib_to_ext[contrib_id]
 
     # =========================================================================
     # --- Private API ---------------------------------------------------------
@@ -246,6 +289,17 @@ class ExtensionsCollector(BaseCollector):
     #: Private storage keeping track of which extension declared which object.
     _extensions = Typed(defaultdict, (list,))
 
+    #: Results of the validation of the registered contributions indexed by the
+    #: id of the contribution object.
+    _validated = Typed(dict, ())
+
+    #: Mapping between the id of a contribution and the extension declaring it.
+    _contrib_to_ext = Typed(dict, ())
+
+    #: Ids of the contributions declared multiple times. Changes involving those
+    #: require a full refresh to determine which declaration prevails.
+    _duplicated_ids = Typed(set, ())
+
     def _refresh_contributions(self) -> None:
         """Refresh the extensions contributions.
 
@@ -262,52 +316,143 @@ class ExtensionsCollector(BaseCollector):
             # Force a notification to be emitted.
             self.contributions = {}
             self._extensions.clear()
+            self._validated.clear()
+            self._contrib_to_ext.clear()
+            self._duplicated_ids.clear()
             return
 
-        extensions = point.extensions
-
-        # Get the contributions declarations for all extensions.
+        # Get the contributions declarations for all extensions and create the
+        # mapping between contrib id and declaration in a single pass.
         new_extensions = defaultdict(list)
         old_extensions = self._extensions
-        for extension in extensions:
+        validate = self.validate_ext
+        validated = self._validated
+        new_validated = {}
+        contribs = {}
+        contrib_to_ext = {}
+        duplicates = defaultdict(int)
+        for extension in point.extensions:
             if extension in old_extensions:
-                contribs = old_extensions[extension]
+                ext_contribs = old_extensions[extension]
             else:
                 try:
-                    contribs = self._load_contributions(extension)
+                    ext_contribs = self._load_contributions(extension)
                 except TypeError as e:
                     tb["Extension " + extension.qualified_id] = "{}".format(e)
                     continue
-            new_extensions[extension].extend(contribs)
+            new_extensions[extension].extend(ext_contribs)
 
-        # Create mapping between contrib id and declaration.
-        contribs = {}
-        for extension in extensions:
-            for contrib in new_extensions[extension]:
-                if contrib.id in contribs:
+            for contrib in ext_contribs:
+                c_id = contrib.id
+                if c_id in contribs:
                     msg = "{} attempted to register already registered '{}'"
-                    pattern = "Duplicate " + contrib.id + "_{}"
-                    i = 0
-                    while pattern.format(i) in tb:
-                        i += 1
-                    tb[pattern.format(i)] = msg.format(
-                        extension.qualified_id, contrib.id
+                    tb[f"Duplicate {c_id}_{duplicates[c_id]}"] = msg.format(
+                        extension.qualified_id, c_id
                     )
-                res, msg = self.validate_ext(contrib)
+                    duplicates[c_id] += 1
+                # Contributions are kept alive by the collector so their id is a
+                # stable key as long as they are registered.
+                key = id(contrib)
+                result = validated.get(key)
+                if result is None:
+                    result = validate(contrib)
+                new_validated[key] = result
+                res, msg = result
                 if not res:
                     ext = "While loading {},".format(extension.qualified_id)
-                    tb[contrib.id] = ext + msg
-                contribs[contrib.id] = contrib
+                    tb[c_id] = ext + msg
+                contribs[c_id] = contrib
+                contrib_to_ext[c_id] = extension
 
         self.contributions = contribs
         self._extensions = new_extensions
+        self._validated = new_validated
+        self._contrib_to_ext = contrib_to_ext
+        self._duplicated_ids = set(duplicates)
         if tb:
-            core = self.workbench.get_plugin("enaml.workbench.core")
-            core.invoke_command(
+            self._core.invoke_command(
                 "gild.errors.signal",
                 {"kind": "extensions", "point": self.point, "errors": tb},
             )
 
+    def _apply_diff(self, added: list, removed: list) -> bool:
+        """Update the contributions for some added and removed extensions.
+
+        Parameters
+        ----------
+        added : list
+            Extensions added to the observed point.
+
+        removed : list
+            Extensions removed from the observed point.
+
+        Returns
+        -------
+        applied : bool
+            False if the update cannot be performed incrementally because the
+            id of an added or removed contribution is declared multiple times.
+            In such a case no change was made.
+
+        """
+        tb = {}
+        duplicated = self._duplicated_ids
+        old_extensions = self._extensions
+
+        # Load the added contributions first so that nothing is modified if we
+        # have to fall back to a full refresh.
+        loaded = []
+        for extension in added:
+            try:
+                ext_contribs = self._load_contributions(extension)
+            except TypeError as e:
+                tb["Extension " + extension.qualified_id] = "{}".format(e)
+                continue
+            loaded.append((extension, ext_contribs))
+
+        removed_ids = set()
+        for extension in removed:
+            removed_ids.update(c.id for c in old_extensions.get(extension, ()))
+        if not removed_ids.isdisjoint(duplicated):
+            return False
+
+        contribs = dict(self.contributions)
+        contrib_to_ext = dict(self._contrib_to_ext)
+        for c_id in removed_ids:
+            del contribs[c_id]
+            del contrib_to_ext[c_id]
+
+        added_ids = set()
+        for extension, ext_contribs in loaded:
+            for contrib in ext_contribs:
+                c_id = contrib.id
+                if c_id in contribs or c_id in added_ids:
+                    return False
+                added_ids.add(c_id)
+                contribs[c_id] = contrib
+                contrib_to_ext[c_id] = extension
+
+        validate = self.validate_ext
+        validated = self._validated
+        for extension in removed:
+            for contrib in old_extensions.pop(extension, ()):
+                validated.pop(id(contrib), None)
+        for extension, ext_contribs in loaded:
+            old_extensions[extension].extend(ext_contribs)
+            for contrib in ext_contribs:
+                res, msg = validated[id(contrib)] = validate(contrib)
+                if not res:
+                    ext = "While loading {},".format(extension.qualified_id)
+                    tb[contrib.id] = ext + msg
+
+        self.contributions = contribs
+        self._contrib_to_ext = contrib_to_ext
+        if tb:
+            self._core.invoke_command(
+                "gild.errors.signal",
+                {"kind": "extensions", "point": self.point, "errors": tb},
+            )
+        return True
+
     def _load_contributions(self, extension: Extension) -> list:
         """Load the contributed objects for the given extension.
 
@@ -322,19 +467,35 @@ class ExtensionsCollector(BaseCollector):
             The objects declared by the extension.
 
         """
-        workbench = self.workbench
-        contribs = extension.get_children(self.ext_class)
+        ext_class = self.ext_class
+        contribs = extension.get_children(ext_class)
         if extension.factory is not None and not contribs:
-            for contrib in extension.factory(workbench):
-                if not isinstance(contrib, self.ext_class):
+            append = contribs.append
+            for contrib in extension.factory(self.workbench):
+                if not isinstance(contrib, ext_class):
                     msg = "extension '{}' created non-{}."
-                    raise TypeError(msg.format(extension.qualified_id, self.ext_class))
-                contribs.append(contrib)
+                    raise TypeError(msg.format(extension.qualified_id, ext_class))
+                append(contrib)
 
         return contribs
 
     def _on_contribs_updated(self, change: Mapping[str, Any]) -> None:
-        """The observer for the extension point"""
+        """The observer for the extension point
+
+        Only the added and removed extensions are processed unless a full
+        refresh is required.
+
+        """
+        old = change.get("oldvalue")
+        new = change["value"]
+        if old and new:
+            old_set = set(old)
+            new_set = set(new)
+            added = [e for e in new if e not in old_set]
+            removed = [e for e in old if e not in new_set]
+            if self._apply_diff(added, removed):
+                return
+
         self._refresh_contributions()
 
 
@@ -350,10 +511,51 @@ class DeclaratorCollector(BaseCollector):
     # --- Private API ---------------------------------------------------------
     # =========================================================================
 
+    #: Declarators contributed by each registered extension. Once registered
+    #: those are never modified so they are stored as tuples.
+    _extensions = Typed(dict, ())
+
     #: Temporary list in which declarations which cannot yet be taken into
     #: account because another declaration has not yet been registered.
     _delayed = List()
 
+    #: Nesting level of the _batching context manager.
+    _batch_depth = Int()
+
+    #: Copy of the contributions taken when entering the outermost batch.
+    _batch_snapshot = Value()
+
+    @contextmanager
+    def _batching(self) -> Iterator[None]:
+        """Emit a single notification for all the changes made in the block.
+
+        Declarators add themselves to the contributions in place so no
+        notification is emitted by those changes. On exiting the outermost
+        block, a notification is emitted if the contributions differ from the
+        ones found when entering.
+
+        """
+        if not self._batch_depth:
+            self._batch_snapshot = self.contributions.copy()
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                old, self._batch_snapshot = self._batch_snapshot, None
+                new = self.contributions
+                if new != old:
+                    change = {
+                        "type": "update",
+                        "object": self,
+                        "name": "contributions",
+                        "oldvalue": old,
+                        "value": new,
+                    }
+                    self.get_member("contributions").notify(self, change)
+                    self.notify("contributions", change)
+
     def _refresh_contributions(self) -> None:
         """Load all extensions contributed to the observed point."""
         workbench = self.workbench
@@ -368,88 +570,80 @@ class DeclaratorCollector(BaseCollector):
         Handle multiple registering attempts.
 
         """
+        with self._batching():
+            self._register_decls_impl(extensions)
+
+    def _register_decls_impl(self, extensions: Iterable[Extension]) -> None:
+        """Register the declarations, notifications are handled by the caller."""
         # Get the declarators for all extensions.
         tb = {}
-        contributions = self.contributions.copy()
-        new_extensions = defaultdict(list)
+        new_extensions = {}
         old_extensions = self._extensions
         for extension in extensions:
-            if extension not in old_extensions:
-                try:
-                    declarators = self._get_decls(extension)
-                except TypeError as e:
-                    tb["Extension " + extension.qualified_id] = "{}".format(e)
-                    continue
-            new_extensions[extension].extend(declarators)
+            if extension in old_extensions:
+                continue
+            try:
+                declarators = self._get_decls(extension)
+            except TypeError as e:
+                tb["Extension " + extension.qualified_id] = "{}".format(e)
+                continue
+            new_extensions[extension] = tuple(declarators)
 
         # Register all contributions.
-        for extension in new_extensions:
-            for declarator in new_extensions[extension]:
+        for declarators in new_extensions.values():
+            for declarator in declarators:
                 declarator.register(self, tb)
 
-        # Handle delayed registering.
-        old = 0
-        while old != len(self._delayed) and self._delayed:
-            # Copy and clean delayed list.
-            delayed = self._delayed[:]
-            old = len(delayed)
-            self._delayed = []
+        # Handle delayed registering, stopping once a pass makes no progress.
+        while self._delayed:
+            delayed, self._delayed = self._delayed, []
 
             # Attempt to re-register delayed declarators
             for declarator in delayed:
                 declarator.register(self, tb)
 
+            if len(self._delayed) == len(delayed):
+                break
+
         if self._delayed:
             msg = "Some declarations have not been registered : {}"
             tb["Missing declarations"] = msg.format(self._delayed)
 
         self._extensions.update(new_extensions)
 
-        if self.contributions != contributions:
-            c = self.contributions
-            with self.suppress_notifications():
-                self.contributions = contributions
-            self.contributions = c
-
         if tb:
-            core = self.workbench.get_plugin("enaml.workbench.core")
-            core.invoke_command(
+            self._core.invoke_command(
                 "gild.errors.signal",
                 {"kind": "extensions", "point": self.point, "errors": tb},
             )
 
     def _get_decls(self, extension: Extension) -> List:
         """Get the task declarations declared by an extension."""
-        workbench = self.workbench
-        contribs = extension.get_children(self.ext_class)
+        ext_class = self.ext_class
+        contribs = extension.get_children(ext_class)
         if extension.factory is not None and not contribs:
-            for contrib in extension.factory(workbench):
-                if not isinstance(contrib, self.ext_class):
+            append = contribs.append
+            for contrib in extension.factory(self.workbench):
+                if not isinstance(contrib, ext_class):
                     msg = "Extension '{}' should create {} not {}."
                     raise TypeError(
                         msg.format(
                             extension.qualified_id,
-                            self.ext_class,
+                            ext_class,
                             type(contrib).__name__,
                         )
                     )
-                contribs.append(contrib)
+                append(contrib)
 
         return contribs
 
-    def _unregister_decls(self, extensions: Mapping[Extension, List]) -> None:
+    def _unregister_decls(self, extensions: Mapping[Extension, Tuple]) -> None:
         """Unregister the declarations linked to some extensions."""
-        contributions = self.contributions.copy()
-        for extension in extensions:
-            for declarator in extensions[extension]:
-                declarator.unregister(self)
-            del self._extensions[extension]
-
-        if self.contributions != contributions:
-            c = self.contributions
-            with self.suppress_notifications():
-                self.contributions = contributions
-            self.contributions = c
+        with self._batching():
+            for extension in extensions:
+                for declarator in extensions[extension]:
+                    declarator.unregister(self)
+                del self._extensions[extension]
 
     def _on_contribs_updated(self, change: Mapping[str, Any]) -> None:
         """Update the registered declarations when an extension is
@@ -465,10 +659,10 @@ class DeclaratorCollector(BaseCollector):
             self._extensions.clear()
             return
 
-        added = new - old
-        removed = old - new
-        self._unregister_decls(
-            {ext: d for ext, d in self._extensions.items() if ext in removed}
-        )
-
-        self._register_decls(added)
+        extensions = self._extensions
+        added = [ext for ext in new - old if ext not in extensions]
+        removed = {ext: extensions[ext] for ext in old - new if ext in extensions}
+        # Emit a single notification for both the removal and the addition.
+        with self._batching():
+            self._unregister_decls(removed)
+            self._register_decls(added)
@@ -17,13 +17,14 @@ _REMOVED = object()
 class PriorityHeap(object):
     """A priority heap implementation based on a heapq."""
 
-    __slots__ = ("_heap", "_map", "_counter")
+    __slots__ = ("_heap", "_map", "_counter", "_removed")
 
     def __init__(self):
         super(PriorityHeap, self).__init__()
         self._heap = []
         self._map = {}
         self._counter = 0
+        self._removed = 0
 
     def push(self, priority, obj):
         """Push a task with a given priority on the queue.
@@ -49,6 +50,7 @@ class PriorityHeap(object):
             if obj is not _REMOVED:
                 del self._map[obj]
                 break
+            self._removed -= 1
         if not self._heap:
             self._counter = 0
         return obj
@@ -64,14 +66,15 @@ class PriorityHeap(object):
             heapobj = self._map[obj]
             heapobj[2] = _REMOVED
             del self._map[obj]
+            self._removed += 1
 
     def __iter__(self):
         """Allow to use this object as an iterator."""
         return self
 
     def __len__(self):
-        """Return the length of the underlying list."""
-        return len([t for t in self._heap if t[2] is not _REMOVED])
+        """Return the number of objects which were not removed."""
+        return len(self._heap) - self._removed
 
     def __next__(self):
         """Iterate over the heap by poping object.
@@ -19,3 +19,7 @@ pytest_plugins = ("gild.testing.fixtures",)
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "ui: mark test involving ui display")
+    # Render off screen unless the user asked to see the dialogs or picked a
+    # platform explicitly.
+    if not config.getoption("--gild-sleep"):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
@@ -10,6 +10,8 @@
 """
 import enaml
 
+from gild.plugins.icons.icon_theme import Icon
+
 with enaml.imports():
     from .contributions import DumbIcon, DummyTheme, DummyThemeExtension
 
@@ -29,3 +31,31 @@ def test_icon_theme_extension():
     """Test listing the icons in an icon theme extension."""
     ext = DummyThemeExtension()
     assert len(ext.icons()) == 1
+
+
+def test_icon_theme_children_tracking():
+    """Test that the icons known to a theme follow its children."""
+    theme = DummyTheme()
+    ext = DummyThemeExtension()
+    assert theme.get_icon(None, "dumb2") is None
+
+    theme.insert_children(None, ext.icons())
+    assert theme.get_icon(None, "dumb2").id == "dumb2"
+
+    ext.insert_children(None, ext.icons())
+    assert theme.get_icon(None, "dumb2") is None
+
+
+def test_icon_theme_extension_children_tracking():
+    """Test that the icons of an extension follow its children."""
+    ext = DummyThemeExtension()
+    icons = ext.icons()
+    assert len(icons) == 1
+
+    new = Icon(id="dumb3")
+    ext.insert_children(None, [new])
+    assert new in ext.icons()
+
+    new.set_parent(None)
+    assert new not in ext.icons()
+    assert len(ext.icons()) == 1
@@ -62,6 +62,49 @@ def test_lifecyle(app, icon_workbench, caplog):
     icon_workbench.unregister("gild.icons")
 
 
+def test_icon_caching(icon_workbench):
+    """Test that resolved icons are cached till the selected theme changes."""
+    icon_workbench.register(ThemeContributor())
+    pl = icon_workbench.get_plugin("gild.icons")
+    pl.current_theme = "dummy"
+    icon = pl.get_icon("dumb1")
+    assert pl.get_icon("dumb1") is icon
+
+    pl.current_theme = "gild.FontAwesome"
+    pl.current_theme = "dummy"
+    assert pl.get_icon("dumb1") is not icon
+
+
+def test_lazy_extensions_collection(icon_workbench):
+    """Test that the theme extensions are only collected when first needed."""
+    icon_workbench.register(ThemeContributor())
+    icon_workbench.register(ThemeExtensionContributor())
+    pl = icon_workbench.get_plugin("gild.icons")
+    assert not pl._extensions_started
+
+    pl.current_theme = "dummy"
+    assert not pl._extensions_started
+    assert pl.get_icon("dumb2") is not None
+    assert pl._extensions_started
+
+    # Extensions registered after the first collection are used without
+    # selecting the theme again.
+    icon_workbench.register(ThemeExtensionContributor2())
+    assert pl.get_icon("dumb3") is not None
+
+    # A re-contributed theme is used and receives the extensions icons.
+    theme = pl._current_theme
+    icon_workbench.unregister("dummy.icon_theme")
+    icon_workbench.register(ThemeContributor())
+    assert pl.current_theme == "dummy"
+    assert pl._current_theme is not theme
+    assert pl.get_icon("dumb2") is not None
+    assert pl.get_icon("dumb3") is not None
+
+    icon_workbench.unregister("gild.icons")
+    assert not pl._extensions_started
+
+
 def test_overriding_preferences_if_absent(icon_workbench):
     """Test that we fall back to FontAwesome is the selected theme in the
     preferences does not exist.
@@ -18,6 +18,7 @@ from enaml.workbench.api import Workbench
 
 from gild.plugins.lifecycle import LifecycleManifest
 from gild.plugins.log import LogManifest
+from gild.plugins.log.plugin import _read_log_tail
 from gild.plugins.log.tools import GuiHandler, LogModel, StreamToLogRedirector
 from gild.plugins.preferences import PreferencesManifest
 from gild.plugins.states import StateManifest
@@ -34,8 +35,14 @@ class CMDArgs(object):
     pass
 
 
-@pytest.fixture
-def workbench(app_name):
+class Filter(object):
+    def filter(self, record):
+        return True
+
+
+@pytest.fixture(scope="module")
+def log_workbench(app_name):
+    """Workbench shared by the tests of this module."""
     workbench = Workbench()
     workbench.register(CoreManifest())
     workbench.register(LifecycleManifest())
@@ -48,6 +55,24 @@ def workbench(app_name):
     workbench.unregister(PLUGIN_ID)
 
 
+@pytest.fixture
+def workbench(log_workbench):
+    """Shared workbench from which the handlers and filters added by a test are
+    removed once it completes.
+
+    """
+    log_plugin = log_workbench.get_plugin(PLUGIN_ID)
+    handlers = set(log_plugin.handler_ids)
+    filters = set(log_plugin.filter_ids)
+
+    yield log_workbench
+
+    for id in set(log_plugin.filter_ids) - filters:
+        log_plugin.remove_filter(id)
+    for id in set(log_plugin.handler_ids) - handlers:
+        log_plugin.remove_handler(id)
+
+
 def test_handler1(workbench, logger):
     """Test adding removing handler."""
     core = workbench.get_plugin("enaml.workbench.core")
@@ -61,13 +86,15 @@ def test_handler1(workbench, logger):
 
     assert log_plugin.handler_ids == ["ui"]
     assert handler in logger.handlers
-    assert log_plugin._handlers == {"ui": (handler, "test")}
+    assert log_plugin._handlers == {"ui": handler}
+    assert log_plugin._handler_loggers == {"ui": "test"}
 
     core.invoke_command("gild.logging.remove_handler", {"id": "ui"}, None)
 
     assert log_plugin.handler_ids == []
     assert handler not in logger.handlers
     assert log_plugin._handlers == {}
+    assert log_plugin._handler_loggers == {}
 
 
 def test_filter1(workbench, logger):
@@ -80,10 +107,6 @@ def test_filter1(workbench, logger):
         None,
     )
 
-    class Filter(object):
-        def filter(self, record):
-            return True
-
     test_filter = Filter()
 
     core.invoke_command(
@@ -113,10 +136,6 @@ def test_filter2(workbench):
         None,
     )
 
-    class Filter(object):
-        def filter(self, record):
-            return True
-
     test_filter = Filter()
 
     core.invoke_command(
@@ -136,31 +155,30 @@ def test_filter2(workbench):
     assert log_plugin._filters == {}
 
 
-def test_filter3(workbench, logger):
-    """Test adding an improper filter."""
+@pytest.mark.parametrize(
+    "test_filter, handler_id",
+    [(object(), "ui"), (Filter(), "non-existing")],
+    ids=["improper-filter", "missing-handler"],
+)
+def test_filter_rejected(workbench, logger, test_filter, handler_id):
+    """Test adding an improper filter or a filter to a non-existing handler."""
     core = workbench.get_plugin("enaml.workbench.core")
-
     core.invoke_command(
-        "gild.logging.add_filter",
-        {"id": "filter", "filter": object(), "handler_id": "ui"},
+        "gild.logging.add_handler",
+        {"id": "ui", "handler": GuiHandler(model=LogModel()), "logger": "test"},
         None,
     )
 
-
-def test_filter4(workbench, logger):
-    """Test adding a filter to a non-existing handler."""
-    core = workbench.get_plugin("enaml.workbench.core")
-
-    class Filter(object):
-        def filter(self, record):
-            return True
-
     core.invoke_command(
         "gild.logging.add_filter",
-        {"id": "filter", "filter": Filter(), "handler_id": "ui"},
+        {"id": "filter", "filter": test_filter, "handler_id": handler_id},
         None,
     )
 
+    log_plugin = workbench.get_plugin(PLUGIN_ID)
+    assert log_plugin.filter_ids == []
+    assert log_plugin._filters == {}
+
 
 def test_formatter(workbench, logger, gild_qtbot):
     """Test setting the formatter of a handler."""
@@ -180,15 +198,14 @@ def test_formatter(workbench, logger, gild_qtbot):
         None,
     )
 
-    logger.info("test")
+    with gild_qtbot.wait_callback() as callback:
+        model.observe("text", callback)
+        logger.info("test")
 
-    def assert_text():
-        assert model.text == "test : test\n"
+    assert model.text == "test : test\n"
 
-    gild_qtbot.wait_until(assert_text)
 
-
-def test_formatter2(workbench, logger, gild_qtbot):
+def test_formatter2(workbench, logger):
     """Test setting the formatter of a non existing handler."""
     core = workbench.get_plugin("enaml.workbench.core")
 
@@ -199,7 +216,14 @@ def test_formatter2(workbench, logger, gild_qtbot):
         None,
     )
 
-    gild_qtbot.wait(10)
+
+def test_read_log_tail(tmp_path):
+    """Test reading only the end of a large log file."""
+    path = tmp_path / "test.log"
+    path.write_text("".join(f"line {i}\n" for i in range(100)), encoding="utf-8")
+
+    assert _read_log_tail(str(path), "utf-8").count("\n") == 100
+    assert _read_log_tail(str(path), "utf-8", 20) == "line 98\nline 99\n"
 
 
 # FIXME figure out why this does not pass on CIs
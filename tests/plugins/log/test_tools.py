@@ -21,6 +21,7 @@ from gild.plugins.log.tools import (
     QueueLoggerThread,
     StreamToLogRedirector,
 )
+from gild.testing.util import preserved_std_streams
 
 
 def test_log_model():
@@ -40,6 +41,38 @@ def test_log_model():
     assert model.text == "".join(["%d\n" % i for i in range(4)])
 
 
+def test_log_model_multiline_and_resize():
+    """Test the log model handling of multiline messages and buffer resizing."""
+    model = LogModel(buff_size=2)
+    model.add_message("0\n1\n2\n3")
+    assert model.text == "1\n2\n3\n"
+
+    model.buff_size = 1
+    assert model.text == "2\n3\n"
+    model.add_message("4")
+    assert model.text == "3\n4\n"
+
+
+def test_log_model_add_messages():
+    """Test adding several messages at once strips each of them."""
+    model = LogModel()
+    model.add_messages([" 0\n", "1 \n", "\n2\n"])
+    assert model.text == "0\n1\n2\n"
+
+
+def test_log_model_text_notification():
+    """Test that observers of the text are notified when messages are added."""
+    model = LogModel()
+    changes = []
+    model.observe("text", lambda change: changes.append(change["value"]))
+
+    model.add_message("0")
+    model.add_message("1")
+    model.clean_text()
+
+    assert changes == ["0\n", "0\n1\n", ""]
+
+
 def test_gui_handler(gild_qtbot, logger, monkeypatch):
     """Test the gui handler."""
     model = LogModel()
@@ -94,19 +127,35 @@ def test_gui_handler(gild_qtbot, logger, monkeypatch):
     logger.info("raise")
 
 
+def test_gui_handler_batching(gild_qtbot, logger):
+    """Test that the gui handler sends bursts of messages in one batch."""
+    model = LogModel()
+    handler = GuiHandler(model)
+    logger.addHandler(handler)
+
+    for i in range(3):
+        logger.info("test%d" % i)
+    assert handler._scheduled
+    assert len(handler._pending) == 3
+    assert model.text == ""
+
+    def assert_text():
+        assert model.text == "test0\ntest1\ntest2\n"
+
+    gild_qtbot.wait_until(assert_text)
+    assert not handler._scheduled
+    assert not handler._pending
+
+
 def test_stdout_redirection(gild_qtbot, logger):
     """Test the redirection of stdout toward a logger."""
     model = LogModel()
     handler = GuiHandler(model)
     logger.addHandler(handler)
-    stdout = sys.stdout
-    sys.stdout = StreamToLogRedirector(logger)
-
-    try:
+    with preserved_std_streams():
+        sys.stdout = StreamToLogRedirector(logger)
         print("test")
         sys.stdout.flush()
-    finally:
-        sys.stdout = stdout
 
     def assert_text():
         assert model.text == "test\n"
@@ -119,13 +168,9 @@ def test_stderr_redirection(gild_qtbot, logger):
     model = LogModel()
     handler = GuiHandler(model)
     logger.addHandler(handler)
-    stdout = sys.stdout
-    sys.stdout = StreamToLogRedirector(logger, stream_type="stderr")
-
-    try:
+    with preserved_std_streams():
+        sys.stdout = StreamToLogRedirector(logger, stream_type="stderr")
         print("test")
-    finally:
-        sys.stdout = stdout
 
     answer = "An error occured please check the log file for more details.\n"
 
@@ -9,6 +9,8 @@
 """Test the PackagesPlugin.
 
 """
+import importlib.metadata
+
 import enaml
 import pytest
 from atom.api import Atom, Bool, Str, Value
@@ -16,7 +18,7 @@ from atom.api import Atom, Bool, Str, Value
 from gild.plugins.errors import ErrorsManifest
 from gild.plugins.lifecycle import LifecycleManifest
 from gild.plugins.packages import PackagesManifest
-from gild.testing.util import handle_dialog
+from gild.testing.util import TrackingWorkbench, handle_dialog
 
 with enaml.imports():
     from enaml.workbench.core.core_manifest import CoreManifest
@@ -28,21 +30,36 @@ APP_ID = "gild.lifecycle"
 PACKAGES_ID = "gild.packages"
 
 
+@pytest.fixture(scope="module")
+def base_workbench():
+    """Create a workbench shared by the tests of this module."""
+    workbench = TrackingWorkbench()
+    with workbench.registration_scope():
+        workbench.register(CoreManifest())
+        workbench.register(LifecycleManifest())
+        workbench.register(ErrorsManifest())
+        yield workbench
+
+
 @pytest.fixture
-def pack_workbench(workbench):
-    """Create a workbench and register basic manifests."""
-    workbench.register(CoreManifest())
-    workbench.register(LifecycleManifest())
-    workbench.register(ErrorsManifest())
-    workbench.register(PackagesManifest(extension_point="test"))
-    return workbench
+def pack_workbench(base_workbench):
+    """Register a fresh packages manifest on the shared workbench.
+
+    The manifests registered during the test are unregistered afterwards.
+
+    """
+    with base_workbench.registration_scope():
+        base_workbench.register(PackagesManifest(extension_point="test"))
+        yield base_workbench
 
 
 def patch_pkg(monkey, answer):
-    """Patch the pkg_resources.iter_entry_points function."""
-    from gild.plugins.packages.plugin import importlib
+    """Patch the importlib.metadata.entry_points function."""
+
+    def entry_points(group=None):
+        return {"test": answer} if group is None else answer
 
-    monkey.setattr(importlib.metadata, "entry_points", lambda: {"test": answer})
+    monkey.setattr(importlib.metadata, "entry_points", entry_points)
 
 
 class FalseEntryPoint(Atom):
@@ -153,6 +170,7 @@ def test_non_manifest(monkeypatch, pack_workbench, gild_qtbot):
         [
             FalseEntryPoint(name="test", manifests=[Manifest1, object]),
             FalseEntryPoint(name="test2", manifests=[]),
+            FalseEntryPoint(name="test3", manifests=[Manifest1, None]),
         ],
     )
 
@@ -165,6 +183,7 @@ def test_non_manifest(monkeypatch, pack_workbench, gild_qtbot):
     assert "test" in plugin.packages
     assert "test2" in plugin.packages
     assert "PluginManifests" in plugin.packages["test"]
+    assert "PluginManifests" in plugin.packages["test3"]
     assert not plugin._registered
 
 
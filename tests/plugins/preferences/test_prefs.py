@@ -9,15 +9,17 @@
 
 """
 import os
+import time
 
 import enaml
 import pytest
 import rtoml as toml
+from enaml.workbench.api import PluginManifest
 
 from gild.plugins.errors import ErrorsManifest
 from gild.plugins.lifecycle import LifecycleManifest
-from gild.plugins.preferences import PreferencesManifest
-from gild.testing.util import handle_dialog
+from gild.plugins.preferences import Preferences, PreferencesManifest
+from gild.testing.util import TrackingWorkbench, handle_dialog
 
 with enaml.imports():
     from enaml.workbench.core.core_manifest import CoreManifest
@@ -27,88 +29,88 @@ with enaml.imports():
 PLUGIN_ID = "gild.preferences"
 
 
+@pytest.fixture(scope="module")
+def base_workbench():
+    """Create a workbench shared by the tests of this module."""
+    workbench = TrackingWorkbench()
+    with workbench.registration_scope():
+        workbench.register(CoreManifest())
+        workbench.register(LifecycleManifest())
+        workbench.register(ErrorsManifest())
+        yield workbench
+
+
 @pytest.fixture
-def pref_workbench(workbench, app_dir, app_name):
-    """Register the plugins resuired to test the preferences plugin."""
-    workbench.register(CoreManifest())
-    workbench.register(LifecycleManifest())
-    workbench.register(ErrorsManifest())
-    workbench.register(PreferencesManifest(application_name=app_name))
-    return workbench
+def pref_workbench(base_workbench, app_dir, app_name):
+    """Register the plugins resuired to test the preferences plugin.
 
+    The manifests registered during the test are unregistered afterwards.
 
-def test_app_startup1(pref_workbench, app_dir_storage, tmpdir, gild_qtbot):
-    """Test app start-up when no app_directory.ini exists."""
-    # Remove the default location
+    """
+    with base_workbench.registration_scope():
+        base_workbench.register(PreferencesManifest(application_name=app_name))
+        yield base_workbench
+
+
+class ResetArgs(object):
+    """Command line arguments requesting to reset the application folder."""
+
+    reset_app_folder = True
+
+
+@pytest.mark.parametrize(
+    "cmd_args, remove_location",
+    [(object(), True), (ResetArgs, False)],
+    ids=["no-location-file", "reset-app-folder"],
+)
+def test_app_startup_select_folder(
+    pref_workbench, app_dir_storage, tmp_path, gild_qtbot, cmd_args, remove_location
+):
+    """Test app start-up when the user is asked to select the app folder."""
     app = pref_workbench.get_plugin("gild.lifecycle")
-    app_dir = tmpdir.join("_test")
-    if app_dir_storage.is_file():
-        os.remove(app_dir_storage)
+    app_dir = tmp_path / "_test"
+    if remove_location and app_dir_storage.is_file():
+        app_dir_storage.unlink()
 
     # Start the app and fake a user answer.
     with handle_dialog(
         gild_qtbot, handler=lambda bot, d: setattr(d, "path", str(app_dir))
     ):
-        app.run_app_startup(object())
+        app.run_app_startup(cmd_args)
 
     assert app_dir_storage.is_file()
     with open(app_dir_storage) as f:
-        assert toml.load(f)["app_path"] == app_dir
-    assert os.path.isdir(app_dir)
+        assert toml.load(f)["app_path"] == str(app_dir)
+    assert app_dir.is_dir()
 
 
-def test_app_startup2(pref_workbench, app_dir_storage, tmpdir, gild_qtbot):
+def test_app_startup_quit(pref_workbench, app_dir_storage, gild_qtbot):
     """Test app start-up when user quit app."""
-    # Remove the default location
     app = pref_workbench.get_plugin("gild.lifecycle")
+    # Remove the default location
     if app_dir_storage.is_file():
-        os.remove(app_dir_storage)
+        app_dir_storage.unlink()
 
     # Start the app and fake a user answer.
-    app = pref_workbench.get_plugin("gild.lifecycle")
-
     with pytest.raises(SystemExit):
         with handle_dialog(gild_qtbot, "reject"):
             app.run_app_startup(object())
 
 
-def test_app_startup3(pref_workbench, app_dir_storage, tmpdir, gild_qtbot):
+def test_app_startup_existing_location(
+    pref_workbench, app_dir_storage, tmp_path, gild_qtbot
+):
     """Test app start-up when a preference file already exists."""
-    # Remove the default location
     app = pref_workbench.get_plugin("gild.lifecycle")
-    app_dir = str(tmpdir.join("_test"))
+    app_dir = tmp_path / "_test"
     with open(app_dir_storage, "w") as f:
-        toml.dump(dict(app_path=app_dir), f)
+        toml.dump(dict(app_path=str(app_dir)), f)
 
-    assert not os.path.isdir(app_dir)
-
-    # Start the app and fake a user answer.
-    app = pref_workbench.get_plugin("gild.lifecycle")
+    assert not app_dir.is_dir()
 
     app.run_app_startup(object())
 
-    assert os.path.isdir(app_dir)
-
-
-def test_app_startup4(pref_workbench, app_dir_storage, tmpdir, gild_qtbot):
-    """Test app start-up when user request to reset app folder."""
-    app_dir = str(tmpdir.join("_test"))
-    app = pref_workbench.get_plugin("gild.lifecycle")
-
-    # Start the app and fake a user answer.
-    app = pref_workbench.get_plugin("gild.lifecycle")
-
-    class DummyArgs(object):
-
-        reset_app_folder = True
-
-    with handle_dialog(gild_qtbot, handler=lambda bot, x: setattr(x, "path", app_dir)):
-        app.run_app_startup(DummyArgs)
-
-    assert os.path.isfile(app_dir_storage)
-    with open(app_dir_storage, "r") as f:
-        assert toml.load(f)["app_path"] == app_dir
-    assert os.path.isdir(app_dir)
+    assert app_dir.is_dir()
 
 
 def test_lifecycle(pref_workbench, app_dir):
@@ -140,6 +142,20 @@ def test_lifecycle(pref_workbench, app_dir):
     assert not prefs._prefs
 
 
+def test_start_without_location_file(pref_workbench, app_dir_storage, app_name):
+    """Test that starting the plugin without location file creates one."""
+    # Remove the default location
+    if app_dir_storage.is_file():
+        app_dir_storage.unlink()
+    prefs = pref_workbench.get_plugin(PLUGIN_ID)
+
+    app_dir = app_dir_storage.parent / app_name
+    assert prefs.app_directory == str(app_dir)
+    assert (app_dir / "preferences").is_dir()
+    with open(app_dir_storage) as f:
+        assert toml.load(f)["app_path"] == str(app_dir)
+
+
 def test_load_defaultini(pref_workbench, app_dir):
     """Test that a default.toml file found in the app folder under prefs
     is loaded on startup.
@@ -177,67 +193,120 @@ def test_load_defaultini(pref_workbench, app_dir):
 #         pref_workbench.register(b_man)
 
 
-def test_auto_sync(pref_workbench, app_dir):
+def test_auto_sync(pref_workbench, app_dir, gild_qtbot):
     """Check that auito_sync members are correctly handled."""
     c_man = PrefContributor()
     pref_workbench.register(c_man)
 
     contrib = pref_workbench.get_plugin(c_man.id)
-    contrib.auto = "test_auto"
-
-    ref = {c_man.id: {"auto": "test_auto"}}
     path = app_dir / "preferences" / "default.toml"
-    assert os.path.isfile(path)
-    with path.open() as f:
-        assert toml.load(f) == ref
+
+    def assert_saved(ref):
+        assert path.is_file()
+        with path.open() as f:
+            assert toml.load(f) == ref
+
+    contrib.auto = "test_auto"
+    gild_qtbot.wait_until(lambda: assert_saved({c_man.id: {"auto": "test_auto"}}))
 
     contrib.auto = "test"
+    gild_qtbot.wait_until(lambda: assert_saved({c_man.id: {"auto": "test"}}))
+
 
-    ref = {c_man.id: {"auto": "test"}}
+def test_auto_sync_coalescing(pref_workbench, app_dir, gild_qtbot):
+    """Check that a burst of auto-saved changes leads to a single write."""
+    c_man = PrefContributor()
+    pref_workbench.register(c_man)
+
+    contrib = pref_workbench.get_plugin(c_man.id)
+    prefs = pref_workbench.get_plugin(PLUGIN_ID)
     path = app_dir / "preferences" / "default.toml"
-    assert os.path.isfile(path)
-    with path.open() as f:
-        assert toml.load(f) == ref
+
+    for i in range(5):
+        contrib.auto = f"test_{i}"
+    assert prefs._auto_save_pending
+    assert not path.exists()
+
+    def assert_saved():
+        assert not prefs._auto_save_pending
+        assert path.is_file()
+        with path.open() as f:
+            assert toml.load(f) == {c_man.id: {"auto": "test_4"}}
+
+    gild_qtbot.wait_until(assert_saved)
 
 
-def test_save1(pref_workbench, app_dir):
-    """Test saving to the default file."""
+def test_save_after_auto_save(pref_workbench, app_dir, monkeypatch):
+    """Check that a queued auto-save cannot overwrite an explicit save."""
     c_man = PrefContributor()
     pref_workbench.register(c_man)
 
     contrib = pref_workbench.get_plugin(c_man.id)
-    contrib.string = "test_save"
+    prefs = pref_workbench.get_plugin(PLUGIN_ID)
+    path = app_dir / "preferences" / "default.toml"
+
+    # Slow down the writer thread so that the explicit save happens while the
+    # auto-saved snapshot is being written.
+    fsync = os.fsync
+
+    def slow_fsync(fd):
+        time.sleep(0.2)
+        fsync(fd)
 
+    monkeypatch.setattr(os, "fsync", slow_fsync)
+
+    contrib.auto = "test_auto"
+    prefs._write_auto_saved()
+    contrib.string = "test_save"
     core = pref_workbench.get_plugin("enaml.workbench.core")
     core.invoke_command("gild.preferences.save", {}, pref_workbench)
+    prefs._write_queue.join()
 
-    path = app_dir / "preferences" / "default.toml"
-    ref = {c_man.id: {"string": "test_save", "auto": ""}}
-    assert os.path.isfile(path)
     with path.open() as f:
-        assert toml.load(f) == ref
+        assert toml.load(f) == {c_man.id: {"string": "test_save", "auto": "test_auto"}}
 
 
-def test_save2(pref_workbench, app_dir):
-    """Test saving to a specific file."""
+@pytest.mark.parametrize(
+    "filename, pass_path",
+    [("default.toml", False), ("custom.toml", True)],
+    ids=["default-file", "given-path"],
+)
+def test_save(pref_workbench, app_dir, filename, pass_path):
+    """Test saving to the default file or to a specific one."""
     c_man = PrefContributor()
     pref_workbench.register(c_man)
 
     contrib = pref_workbench.get_plugin(c_man.id)
     contrib.string = "test_save"
 
-    path = app_dir / "preferences" / "custom.toml"
+    path = app_dir / "preferences" / filename
+    parameters = {"path": path} if pass_path else {}
     core = pref_workbench.get_plugin("enaml.workbench.core")
-    core.invoke_command("gild.preferences.save", {"path": path})
+    core.invoke_command("gild.preferences.save", parameters, pref_workbench)
 
     ref = {c_man.id: {"string": "test_save", "auto": ""}}
-    assert os.path.isfile(path)
+    assert path.is_file()
     with path.open() as f:
         assert toml.load(f) == ref
 
 
-def test_save3(pref_workbench, app_dir, monkeypatch):
-    """Test saving to a specific file."""
+def test_save_without_creating_plugins(pref_workbench, app_dir):
+    """Test that saving does not create plugins and keeps their preferences."""
+    c_man = PrefContributor()
+    pref_workbench.register(c_man)
+    pref_workbench.get_plugin(PLUGIN_ID)._prefs = {c_man.id: {"string": "stored"}}
+
+    core = pref_workbench.get_plugin("enaml.workbench.core")
+    core.invoke_command("gild.preferences.save", {}, pref_workbench)
+
+    assert pref_workbench.get_plugin(c_man.id, False) is None
+    path = app_dir / "preferences" / "default.toml"
+    with path.open() as f:
+        assert toml.load(f) == {c_man.id: {"string": "stored"}}
+
+
+def test_save_ask_user(pref_workbench, app_dir, monkeypatch):
+    """Test saving to a file selected by the user."""
     c_man = PrefContributor()
     pref_workbench.register(c_man)
 
@@ -258,7 +327,7 @@ def test_save3(pref_workbench, app_dir, monkeypatch):
     core.invoke_command("gild.preferences.save", {"path": prefs_path, "ask_user": True})
 
     ref = {c_man.id: {"string": "test_save", "auto": ""}}
-    assert os.path.isfile(path)
+    assert path.is_file()
     with path.open() as f:
         assert toml.load(f) == ref
     assert pref_workbench.get_plugin(PLUGIN_ID).last_directory == str(prefs_path)
@@ -339,3 +408,11 @@ def test_load4(pref_workbench, app_dir, monkeypatch):
 
     assert contrib.string == "test"
     assert pref_workbench.get_plugin(PLUGIN_ID).last_directory == str(prefs_path)
+
+
+def test_preferences_id_cache():
+    """Test that the id of a Preferences is updated when it is reparented."""
+    pref = Preferences(parent=PluginManifest(id="first"))
+    assert pref.id == "first"
+    pref.set_parent(PluginManifest(id="second"))
+    assert pref.id == "second"
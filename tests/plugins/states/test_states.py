@@ -13,6 +13,8 @@ import enaml
 from enaml.workbench.api import Workbench
 from pytest import raises
 
+from gild.plugins.states import State
+
 with enaml.imports():
     from enaml.workbench.core.core_manifest import CoreManifest
 
@@ -68,6 +70,24 @@ class TestState(object):
 
         assert state.string == "test"
 
+        plugin.other = 1
+        assert state.other == 1
+
+    def test_member_observation(self):
+        """Test observing a state member after another state class was created."""
+        core = self.workbench.get_plugin(CORE_PLUGIN)
+        par = {"state_id": STATE_ID}
+        state = core.invoke_command(GET_STATE, par, trigger=self)
+
+        plugin = self.workbench.get_plugin("gild.states")
+        plugin._get_state_class("test.states.other", State(sync_members=["foo"]))
+
+        assert type(state).string.name == "string"
+        changes = []
+        state.observe("string", changes.append)
+        self.workbench.get_plugin("test.states").string = "test"
+        assert changes and changes[-1]["value"] == "test"
+
     def test_death_notif(self):
         """Test that a state whose plugin is unregistered is marked as dead."""
         core = self.workbench.get_plugin(CORE_PLUGIN)
@@ -76,3 +96,29 @@ class TestState(object):
 
         self.workbench.unregister("test.states")
         assert not state.alive
+
+    def test_state_class_reuse(self):
+        """Test that the state class is reused when a state is rebuilt."""
+        core = self.workbench.get_plugin(CORE_PLUGIN)
+        par = {"state_id": STATE_ID}
+        state1 = core.invoke_command(GET_STATE, par, trigger=self)
+
+        self.workbench.unregister("test.states")
+        self.workbench.register(StateContributor())
+        state2 = core.invoke_command(GET_STATE, par, trigger=self)
+
+        assert state1 is not state2
+        assert state2.alive
+        assert type(state1) is type(state2)
+
+    def test_prewarm(self):
+        """Test that the state classes can be created ahead of time."""
+        plugin = self.workbench.get_plugin("gild.states")
+        plugin._prewarm()
+        assert len(plugin._state_classes) == 1
+        assert self.workbench.get_plugin("test.states", force_create=False) is None
+
+        core = self.workbench.get_plugin(CORE_PLUGIN)
+        par = {"state_id": STATE_ID}
+        state = core.invoke_command(GET_STATE, par, trigger=self)
+        assert type(state) in plugin._state_classes.values()
@@ -49,12 +49,11 @@ def test_app_window(gild_qtbot, workbench_and_tools):
     ui = w.get_plugin("enaml.workbench.ui")
     ui.show_window()
 
-    ui.close_window()
-
-    def assert_closing_called():
-        assert closing.called
+    with gild_qtbot.wait_callback() as callback:
+        closing.observe("called", callback)
+        ui.close_window()
 
-    gild_qtbot.wait_until(assert_closing_called)
+    assert closing.called
     assert ui.window.visible
 
     closing.accept = True
@@ -0,0 +1,145 @@
+# -----------------------------------------------------------------------------
+# Copyright 2022 Gild Authors, see AUTHORS for more details.
+#
+# Distributed under the terms of the BSD license.
+#
+# The full license is in the file LICENCE, distributed with this software.
+# -----------------------------------------------------------------------------
+"""Test for the extensible argument parser.
+
+"""
+from pytest import raises
+
+from gild.utils import argparse
+from gild.utils.argparse import ArgParser, extend_parser
+
+
+def test_choices_resolution():
+    """Test that choices aliases are resolved when parsing."""
+    parser = ArgParser()
+    parser.add_choice("workspaces", "gild.workspace.test", "test")
+    parser.add_choice("workspaces", "gild.workspace.other")
+    parser.add_argument("--workspace", choices="workspaces")
+    parser.add_argument("--verbose", action="store_true")
+
+    args = parser.parse_args(["--workspace", "test", "--verbose"])
+    assert args.workspace == "gild.workspace.test"
+    assert args.verbose
+
+    args = parser.parse_args(["--workspace", "gild.workspace.other"])
+    assert args.workspace == "gild.workspace.other"
+    assert not args.verbose
+
+
+def test_choices_resolution_argument_names():
+    """Test resolving choices for dashed, short and explicit destinations."""
+    parser = ArgParser()
+    parser.add_choice("kinds", "gild.kind.a", "a")
+    parser.add_argument("-k", "--kind-name", choices="kinds")
+    parser.add_argument("-o", choices="kinds")
+    parser.add_argument("--other", choices="kinds", dest="target")
+
+    args = parser.parse_args(["--kind-name", "a", "-o", "a", "--other", "a"])
+    assert args.kind_name == "gild.kind.a"
+    assert args.o == "gild.kind.a"
+    assert args.target == "gild.kind.a"
+
+
+def test_positional_arguments_are_rejected():
+    """Test that only optional arguments can be added."""
+    parser = ArgParser()
+    with raises(ValueError):
+        parser.add_argument("workspace")
+
+
+class FakeEntryPoint:
+    """Entry point returning a parser modifier."""
+
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+    def load(self):
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+
+def test_extend_parser(monkeypatch):
+    """Test extending a parser using entry points and caching them."""
+
+    def modifier(parser):
+        parser.add_argument("--extended", action="store_true")
+
+    calls = []
+
+    def entry_points(group):
+        calls.append(group)
+        return [FakeEntryPoint("ep", (modifier, 0))]
+
+    monkeypatch.setattr(argparse, "_MODIFIERS_CACHE", {})
+    monkeypatch.setattr(argparse, "iter_entry_points", entry_points)
+
+    for _ in range(2):
+        parser = ArgParser()
+        extend_parser(parser, "gild.test", None)
+        assert parser.parse_args(["--extended"]).extended
+    assert calls == ["gild.test"]
+
+
+def test_extend_parser_errors(monkeypatch):
+    """Test that loading errors are reported and not cached."""
+
+    def entry_points(group):
+        return [FakeEntryPoint("broken", ImportError())]
+
+    monkeypatch.setattr(argparse, "_MODIFIERS_CACHE", {})
+    monkeypatch.setattr(argparse, "iter_entry_points", entry_points)
+
+    errors = []
+    for _ in range(2):
+        extend_parser(ArgParser(), "gild.test", lambda *args: errors.append(args))
+    assert len(errors) == 2
+    assert "broken" in errors[0][0]
+
+
+def test_extend_parser_priority(monkeypatch):
+    """Test that modifiers are applied by priority and then declaration order."""
+    applied = []
+
+    def make_modifier(name):
+        return lambda parser: applied.append(name)
+
+    def entry_points(group):
+        return [
+            FakeEntryPoint("a", (make_modifier("a"), 2)),
+            FakeEntryPoint("b", (make_modifier("b"), 1)),
+            FakeEntryPoint("c", (make_modifier("c"), 2)),
+        ]
+
+    monkeypatch.setattr(argparse, "_MODIFIERS_CACHE", {})
+    monkeypatch.setattr(argparse, "iter_entry_points", entry_points)
+
+    extend_parser(ArgParser(), "gild.test", None)
+    assert applied == ["b", "a", "c"]
+
+
+def test_extend_parser_modifier_error(monkeypatch):
+    """Test that the entry point whose modifier failed is reported."""
+
+    def fail(parser):
+        raise RuntimeError()
+
+    def entry_points(group):
+        return [
+            FakeEntryPoint("ok", (lambda parser: None, 0)),
+            FakeEntryPoint("failing", (fail, 1)),
+        ]
+
+    monkeypatch.setattr(argparse, "_MODIFIERS_CACHE", {})
+    monkeypatch.setattr(argparse, "iter_entry_points", entry_points)
+
+    errors = []
+    extend_parser(ArgParser(), "gild.test", lambda *args: errors.append(args))
+    assert len(errors) == 1
+    assert "failing" in errors[0][1]
@@ -12,10 +12,12 @@
 from collections import OrderedDict
 
 import pytest
-from atom.api import Constant, Enum, Float, Int, List, Str, Typed, Value
+from atom.api import Atom, Constant, Enum, Float, Int, List, Str, Typed, Value
 
 from gild.utils.atom_util import (
     HasPrefAtom,
+    _may_hold_pref_atom,
+    clear_caches,
     member_from_pref,
     member_to_pref,
     tagged_members,
@@ -66,29 +68,47 @@ def test_false_to_pref_softerror():
 
 def test_tagged_members1():
     aux = _Aux()
-    members = sorted(tagged_members(aux, "pref").keys())
-    test = sorted(
-        ["string", "float_n", "enum", "enum_float", "list_", "atom", "value", "const"]
-    )
+    members = set(tagged_members(aux, "pref"))
+    test = {
+        "string",
+        "float_n",
+        "enum",
+        "enum_float",
+        "list_",
+        "atom",
+        "value",
+        "const",
+    }
     assert members == test
 
 
+def test_tagged_members_cache():
+    aux = _Aux()
+    members = tagged_members(aux, "pref")
+    assert tagged_members(_Aux(), "pref") is members
+    with pytest.raises(TypeError):
+        members["a"] = None  # type: ignore
+    clear_caches()
+    assert tagged_members(aux, "pref") is not members
+    assert tagged_members(aux, "pref") == members
+    # Unhashable metadata values are supported but not cached.
+    assert tagged_members(aux, "pref", [1]) == {}
+
+
 def test_tagged_members3():
     aux = _Aux()
-    members = sorted(tagged_members(aux).keys())
-    test = sorted(
-        [
-            "string",
-            "float_n",
-            "enum",
-            "enum_float",
-            "list_",
-            "atom",
-            "no_tag",
-            "value",
-            "const",
-        ]
-    )
+    members = set(tagged_members(aux))
+    test = {
+        "string",
+        "float_n",
+        "enum",
+        "enum_float",
+        "list_",
+        "atom",
+        "no_tag",
+        "value",
+        "const",
+    }
     assert members == test
 
 
@@ -192,3 +212,54 @@ def test_pref_from_members():
     assert pref["enum_float"] == 1.0
     assert pref["list_"] == []
     assert pref["atom"] == {"int_": 0}
+
+
+class _Conv(HasPrefAtom):
+
+    int_ = Int().tag(
+        pref=(lambda obj, member, val: str(val), lambda obj, member, val: int(val))
+    )
+
+    str_ = Str().tag(pref=(lambda obj, member, val: val.upper(), None))
+
+
+def test_pref_converters():
+    aux = _Conv(int_=2, str_="a")
+    assert aux.preferences_from_members() == {"int_": "2", "str_": "A"}
+    aux.update_members_from_preferences({"int_": "3", "str_": "b"})
+    assert aux.int_ == 3
+    assert aux.str_ == "b"
+
+    # Invalid declarations only raise when the member is converted.
+    with pytest.raises(NotImplementedError):
+        _Faux().preferences_from_members()
+
+
+def test_may_hold_pref_atom():
+    assert not _may_hold_pref_atom(_Aux.string)
+    assert not _may_hold_pref_atom(_Aux.list_)
+    assert _may_hold_pref_atom(Typed(int))
+    assert _may_hold_pref_atom(_Aux.atom)
+    assert _may_hold_pref_atom(_Aux.value)
+    assert _may_hold_pref_atom(Typed(Atom))
+
+
+class _MixinBase(Atom):
+    pass
+
+
+class _Mixed(_MixinBase, HasPrefAtom):
+    child = Str("a").tag(pref=True)
+
+
+class _MixinOwner(HasPrefAtom):
+    nested = Typed(_MixinBase).tag(pref=True)
+
+
+def test_nested_pref_atom_mixin():
+    """Test handling a HasPrefAtom stored in a member typed with another base."""
+    owner = _MixinOwner(nested=_Mixed())
+    assert owner.preferences_from_members() == {"nested": {"child": "a"}}
+
+    owner.update_members_from_preferences({"nested": {"child": "b"}})
+    assert owner.nested.child == "b"
@@ -68,6 +68,22 @@ def test_group_declarator_group(declarators):
     assert declarators[1].get_group() is None
 
 
+def test_deeply_nested_declarators():
+    """Test getting the path and group of a deeply nested declarator."""
+    root = parent = GroupDeclarator(path="root", group="g")
+    for i in range(2000):
+        child = GroupDeclarator(path="" if i % 2 else f"p{i}")
+        parent.insert_children(None, [child])
+        parent = child
+    decl = DummyDeclarator()
+    parent.insert_children(None, [decl])
+
+    path = decl.get_path()
+    assert path.startswith("root.p0.p2.")
+    assert path.endswith(".p1998")
+    assert decl.get_group() == root.group
+
+
 def test_group_declarator_str(declarators):
     """Test the __str__ method."""
     st = str(declarators[0])
@@ -98,6 +114,23 @@ def test_group_registering2(declarators):
     assert "Error 0" in tb
 
 
+def test_group_registering_path_validation(declarators):
+    """Test the validation of the group path."""
+    gr, _, _ = declarators
+
+    for path in ("", "foo", "foo.bar", ".foo.bar_1"):
+        gr.path = path
+        tb = {}
+        gr.register(None, tb)
+        assert not tb
+
+    for path in ("foo.", "foo..bar", "foo bar", "a" * 30 + "!"):
+        gr.path = path
+        tb = {}
+        gr.register(None, tb)
+        assert "Error 0" in tb
+
+
 def test_group_registering3(declarators):
     """Test group registering with bad child."""
     gr, _, _ = declarators
@@ -125,3 +158,19 @@ def test_import_and_get():
 
     import_and_get("gild.utils.declarator", "___D", tb, "test")
     assert "AttributeError" in tb["test"]
+
+
+def test_import_and_get_cache(monkeypatch):
+    """Test that successfully retrieved objects are cached."""
+    from gild.utils import declarator
+
+    monkeypatch.setattr(declarator, "_IMPORT_CACHE", {})
+    assert import_and_get("gild.utils.declarator", "Declarator", {}, "") is Declarator
+    assert declarator._IMPORT_CACHE == {
+        ("gild.utils.declarator", "Declarator"): Declarator
+    }
+
+    tb = {}
+    import_and_get("gild.utils.declarator", "___D", tb, "test")
+    assert "AttributeError" in tb["test"]
+    assert len(declarator._IMPORT_CACHE) == 1
@@ -31,3 +31,8 @@ def test_destroy_hook():
     test.observe("ended", observer)
     test.destroy()
     assert observer.i == 1
+
+
+def test_destroy_hook_class_reuse():
+    """Check that a single subclass is created per base class."""
+    assert add_destroy_hook(Window) is add_destroy_hook(Window)
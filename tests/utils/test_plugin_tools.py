@@ -15,7 +15,11 @@ from enaml.workbench.api import Workbench
 
 from gild.plugins.errors import ErrorsManifest
 from gild.testing.util import handle_dialog
-from gild.utils.plugin_tools import make_extension_validator
+from gild.utils.plugin_tools import (
+    ExtensionsCollector,
+    make_extension_validator,
+    make_handler,
+)
 
 with enaml.imports():
     from enaml.workbench.core.core_manifest import CoreManifest
@@ -53,6 +57,39 @@ def test_make_extension_validator():
     assert c_validator(CContribution(description="test"))[0] is True
 
 
+def test_make_handler():
+    """Test that handlers use the currently registered plugin."""
+
+    class FakePlugin(object):
+        def __init__(self, value):
+            self.value = value
+
+        def get(self, offset):
+            return self.value + offset
+
+    class FakeWorkbench(object):
+        plugin = None
+
+        def get_plugin(self, id):
+            assert id == "test.plugin"
+            return self.plugin
+
+    class FakeEvent(object):
+        workbench = FakeWorkbench()
+        parameters = {"offset": 1}
+
+    handler = make_handler("test.plugin", "get")
+    assert handler.__name__ == "handler_get"
+    assert make_handler("test.plugin", "get") is handler
+    assert make_handler("test.plugin2", "get") is not handler
+    event = FakeEvent()
+    event.workbench.plugin = FakePlugin(1)
+    assert handler(event) == 2
+    # The plugin may be unregistered and registered again between calls.
+    event.workbench.plugin = FakePlugin(2)
+    assert handler(event) == 3
+
+
 class TestExtensionsCollector(object):
     """Test the ExtensionsCollector behaviour."""
 
@@ -131,6 +168,66 @@ class TestExtensionsCollector(object):
         with handle_dialog(gild_qtbot):
             self.workbench.get_plugin(PLUGIN_ID)
 
+    def test_validation_memoization(self, gild_qtbot):
+        """Test that already registered contributions are not validated again."""
+        self.workbench.register(Contributor1())
+        plugin = self.workbench.get_plugin(PLUGIN_ID)
+        validate = plugin.contribs.validate_ext
+        validated = []
+
+        def counting_validate(contrib):
+            validated.append(contrib.id)
+            return validate(contrib)
+
+        plugin.contribs.validate_ext = counting_validate
+        c = Contributor2()
+        self.workbench.register(c)
+        assert validated == ["contrib2.contrib"]
+        assert len(plugin.contribs._validated) == 2
+
+        self.workbench.unregister(c.id)
+        assert validated == ["contrib2.contrib"]
+        assert len(plugin.contribs._validated) == 1
+
+        plugin.contribs.stop()
+        assert not plugin.contribs._validated
+
+    def test_incremental_update(self, gild_qtbot, monkeypatch):
+        """Test that adding/removing an extension does not trigger a full refresh."""
+        self.workbench.register(Contributor1())
+        plugin = self.workbench.get_plugin(PLUGIN_ID)
+        contribs = plugin.contribs
+        first = contribs.contributions["contrib1.contrib"]
+
+        def refresh(self):
+            raise AssertionError("Unexpected full refresh")
+
+        monkeypatch.setattr(ExtensionsCollector, "_refresh_contributions", refresh)
+        c = Contributor2()
+        self.workbench.register(c)
+        extension = c.extensions[0]
+        assert sorted(contribs.contributions) == ["contrib1.contrib", "contrib2.contrib"]
+        assert contribs.contributed_by("contrib2.contrib") is extension
+
+        self.workbench.unregister(c.id)
+        assert list(contribs.contributions) == ["contrib1.contrib"]
+        assert contribs.contributions["contrib1.contrib"] is first
+        assert extension not in contribs._extensions
+
+    @pytest.mark.ui
+    def test_incremental_update_duplicates(self, gild_qtbot):
+        """Test that removing a duplicated contribution restores the other one."""
+        c1 = Contributor1()
+        self.workbench.register(c1)
+        plugin = self.workbench.get_plugin(PLUGIN_ID)
+        with handle_dialog(gild_qtbot):
+            self.workbench.register(Contributor1(id="bis"))
+        assert plugin.contribs._duplicated_ids == {"contrib1.contrib"}
+
+        self.workbench.unregister("bis")
+        assert plugin.contribs.contributed_by("contrib1.contrib") is c1.extensions[0]
+        assert not plugin.contribs._duplicated_ids
+
     def test_declared_by(self):
         """Test getting the extension declaring a particular contribution."""
         c = Contributor1()
@@ -139,6 +236,10 @@ class TestExtensionsCollector(object):
 
         assert plugin.contribs.contributed_by("contrib1.contrib") is c.extensions[0]
 
+        self.workbench.unregister(c.id)
+        with pytest.raises(KeyError):
+            plugin.contribs.contributed_by("contrib1.contrib")
+
 
 class TestDeclaratorCollector(object):
     """Test the ExtensionsCollector behaviour."""
@@ -199,6 +300,26 @@ class TestDeclaratorCollector(object):
         assert w.called == 2
         assert not plugin.contribs._extensions
 
+    def test_batched_notifications(self, gild_qtbot):
+        """Test that nested batches lead to a single notification."""
+        plugin = self.workbench.get_plugin(PLUGIN_ID)
+        changes = []
+        plugin.contribs.observe("contributions", changes.append)
+
+        with plugin.contribs._batching():
+            plugin.contribs.contributions["a"] = 1
+            with plugin.contribs._batching():
+                plugin.contribs.contributions["b"] = 2
+            assert not changes
+
+        assert len(changes) == 1
+        assert changes[0]["oldvalue"] == {}
+        assert changes[0]["value"] == {"a": 1, "b": 2}
+
+        with plugin.contribs._batching():
+            pass
+        assert len(changes) == 1
+
     def test_factory(self, gild_qtbot):
         """Test getting the TestDeclarator declaration from a factory."""
         d = DContributor2()
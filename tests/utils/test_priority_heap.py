@@ -44,6 +44,7 @@ class TestPriorityHeap(object):
         self.queue.remove(5)
         assert len(self.queue) == 1
         assert self.queue.pop() == 6
+        assert len(self.queue) == 0
 
     def test_pushing_while_iterating(self):
 